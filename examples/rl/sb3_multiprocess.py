@@ -16,6 +16,7 @@ import argparse
 import math
 import random
 import time
+from dataclasses import dataclass
 
 from simulate import logging
 
@@ -89,19 +90,29 @@ def generate_map(index):
     return maze
 
 
-def generate_env(port):
-    env = sm.ParallelRLEnv(generate_map, args.n_maps, args.n_show, engine_exe=args.build_exe, engine_port=port)
+@dataclass
+class EnvConfig:
+    """Settings of the environment spawned on each port (only plain values, so it can be pickled cheaply)."""
 
-    return env
+    engine_exe: str
+    n_maps: int
+    n_show: int
+
+    def __call__(self, port):
+        return sm.ParallelRLEnv(generate_map, self.n_maps, self.n_show, engine_exe=self.engine_exe, engine_port=port)
 
 
 parser = argparse.ArgumentParser()
 parser.add_argument("--build_exe", default="", type=str, required=False, help="Pre-built unity app for simulate")
 parser.add_argument("--n_maps", default=12, type=int, required=False, help="Number of maps to spawn")
 parser.add_argument("--n_show", default=4, type=int, required=False, help="Number of maps to show")
+parser.add_argument(
+    "--n_parallel", default=4, type=int, required=False, help="Number of executables to run in parallel"
+)
 args = parser.parse_args()
 # args.build_exe = "./builds/simulate_unity.x86_64"
-env = sm.MultiProcessRLEnv(generate_env, 2)
+env_config = EnvConfig(engine_exe=args.build_exe, n_maps=args.n_maps, n_show=args.n_show)
+env = sm.MultiProcessRLEnv(env_config, args.n_parallel)
 
 time.sleep(2.0)
 model = PPO("MultiInputPolicy", env, verbose=3, n_epochs=2)
@@ -98,6 +98,11 @@ TESTS_REQUIRE = [
 
     "gym",  # For RL action spaces and API
     "stable-baselines3",  # For training with SB3
+    "numba",  # For testing the compiled kernels against their numpy fallbacks
+]
+
+NUMBA_REQUIRE = [
+    "numba",  # For compiling the batched numerical kernels (optional, falls back to numpy)
 ]
 
 DOCS_REQUIRE = [
@@ -109,6 +114,7 @@ QUALITY_REQUIRE = ["black[jupyter]~=22.0", "flake8>=3.8.3", "isort>=5.0.0", "pyy
 EXTRAS_REQUIRE = {
     "rl": RL_REQUIRE,
     "sb3": SB3_REQUIRE,
+    "numba": NUMBA_REQUIRE,
     "dev": DEV_REQUIRE + TESTS_REQUIRE + QUALITY_REQUIRE,
     "test": TESTS_REQUIRE,
     "quality": QUALITY_REQUIRE,
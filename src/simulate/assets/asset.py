@@ -97,7 +97,7 @@ class Asset(NodeMixin, object):
     ):
         asset_id = next(getattr(self.__class__, f"_{self.__class__.__name__}__NEW_ID"))
         if name is None:
-            name = camelcase_to_snakecase(self.__class__.__name__ + f"_{asset_id:02d}")
+            name = camelcase_to_snakecase(self.__class__.__name__) + f"_{asset_id:02d}"
         self.name = name
 
         self.tree_parent = parent
@@ -124,6 +124,12 @@ class Asset(NodeMixin, object):
         self._n_copies = 0
         self._created_from_file = created_from_file
 
+        # Contiguous buffer reused by `tree_transforms` when this asset is used as a root
+        self._transforms_buffer = None
+        # Flattened reward functions built by `flat_reward_functions` when this asset is an actor
+        self._flat_reward_functions = None
+        self._flat_reward_functions_key = None
+
     def _repr_info_str(self) -> str:
         """Used to add additional information to the __repr__ method."""
         return ""
@@ -383,6 +389,73 @@ class Asset(NodeMixin, object):
 
         return [getattr(sensor, "sensor_tag") for sensor in sensors]
 
+    @property
+    def flat_reward_functions(self) -> Optional["FlatRewardFunctions"]:  # noqa: F821
+        """
+        Get the reward functions of the actor flattened into arrays, to evaluate them without traversing the trees.
+        Like in the engine, the reward functions of the actor are its direct children.
+        They are built once and rebuilt only when the reward functions of the actor or their fields change.
+
+        Returns:
+            flat_reward_functions (`FlatRewardFunctions`):
+                The flattened reward functions of the actor.
+        """
+        if not self.is_actor:
+            return None
+
+        from .reward_functions import FlatRewardFunctions, RewardFunction
+
+        reward_functions = [node for node in self.tree_children if isinstance(node, RewardFunction)]
+        nodes = itertools.chain.from_iterable((node,) + node.tree_descendants for node in reward_functions)
+        # Entities are compared by identity
+        key = tuple(
+            (
+                id(node),
+                id(node.tree_parent),
+                node.type,
+                node.scalar,
+                node.threshold,
+                node.distance_metric,
+                id(node.entity_a),
+                id(node.entity_b),
+                node.trigger_once,
+                node.is_collectable,
+            )
+            for node in nodes
+        )
+        if self._flat_reward_functions is None or key != self._flat_reward_functions_key:
+            self._flat_reward_functions = FlatRewardFunctions(reward_functions)
+            self._flat_reward_functions_key = key
+        return self._flat_reward_functions
+
+    @property
+    def tree_transforms(self) -> np.ndarray:
+        """
+        Get the position, rotation and scaling of the asset and of all its descendants packed in a single
+        contiguous float32 array, e.g. to gather the state of a whole scene in one block.
+
+        Rows follow the order of `(self,) + self.tree_descendants` and columns are
+        `[x, y, z, qx, qy, qz, qw, sx, sy, sz]`.
+        The array is a view on a buffer owned by the asset which is reused (and grown geometrically) between calls,
+        copy it if you need to keep the values.
+
+        Returns:
+            transforms (`np.ndarray`):
+                Array of shape (n_nodes, 10) with the local transforms of the nodes.
+        """
+        nodes = (self,) + self.tree_descendants
+        n_nodes = len(nodes)
+
+        if self._transforms_buffer is None or len(self._transforms_buffer) < n_nodes:
+            size = n_nodes if self._transforms_buffer is None else max(n_nodes, 2 * len(self._transforms_buffer))
+            self._transforms_buffer = np.empty((size, 10), dtype=np.float32)
+
+        transforms = self._transforms_buffer[:n_nodes]
+        transforms[:, 0:3] = [node.position for node in nodes]
+        transforms[:, 3:7] = [node.rotation for node in nodes]
+        transforms[:, 7:10] = [node.scaling for node in nodes]
+        return transforms
+
     def __len__(self) -> int:
         return len(self.tree_descendants)
 
@@ -985,19 +1058,14 @@ class Asset(NodeMixin, object):
             value (`float` or `List[float]` or `np.ndarray` or `Tuple` or `property`, *optional*, defaults to `None`):
                 The position of the asset in the scene.
         """
-        if self.dimensionality == 3:
-            if value is None or isinstance(value, property):
-                value = [0.0, 0.0, 0.0]
-            elif isinstance(value, (list, tuple, np.ndarray)) and len(value) != 3:
-                raise ValueError("position should be of size 3 (X, Y, Z)")
-            elif isinstance(value, (list, tuple, np.ndarray)) and len(value) == 3:
-                value = [float(v) for v in value]
-            else:
-                raise TypeError("Position must be a list of 3 numbers")
-        elif self.dimensionality == 2:
-            raise NotImplementedError()
+        if value is None or isinstance(value, property):
+            value = [0.0, 0.0, 0.0]
+        elif not isinstance(value, (list, tuple, np.ndarray)):
+            raise TypeError("Position must be a list of 3 numbers")
+        elif len(value) != 3:
+            raise ValueError("position should be of size 3 (X, Y, Z)")
 
-        new_position = np.array(value)
+        new_position = np.array(value, dtype=np.float64)
         if not np.array_equal(self._position, new_position):
             self._position = new_position
             self._transformation_matrix = get_transform_from_trs(self._position, self._rotation, self._scaling)
@@ -1013,19 +1081,15 @@ class Asset(NodeMixin, object):
             value (`float` or `List[float]` or `np.ndarray` or `Tuple` or `property`, *optional*, defaults to `None`):
                 The rotation of the asset in the scene.
         """
-        if self.dimensionality == 3:
-            if value is None or isinstance(value, property):
-                value = [0.0, 0.0, 0.0, 1.0]
-            elif isinstance(value, (list, tuple, np.ndarray)) and len(value) == 3:
-                value = rotation_from_euler_degrees(*value)
-            elif isinstance(value, (list, tuple, np.ndarray)) and len(value) == 4:
-                value = [float(v) for v in value]
-            else:
-                raise ValueError("Rotation should be of size 3 (Euler angles) or 4 (Quaternions")
-        elif self.dimensionality == 2:
-            raise NotImplementedError()
+        if value is None or isinstance(value, property):
+            value = [0.0, 0.0, 0.0, 1.0]
+        elif isinstance(value, (list, tuple, np.ndarray)) and len(value) == 3:
+            value = rotation_from_euler_degrees(*value)
+        elif not isinstance(value, (list, tuple, np.ndarray)) or len(value) != 4:
+            raise ValueError("Rotation should be of size 3 (Euler angles) or 4 (Quaternions")
 
-        new_rotation = np.array(value) / np.linalg.norm(value)
+        new_rotation = np.array(value, dtype=np.float64)
+        new_rotation /= np.linalg.norm(new_rotation)
         if not np.array_equal(self._rotation, new_rotation):
             self._rotation = new_rotation
             self._transformation_matrix = get_transform_from_trs(self._position, self._rotation, self._scaling)
@@ -1041,19 +1105,14 @@ class Asset(NodeMixin, object):
             value (`float` or `List[float]` or `np.ndarray` or `Tuple` or `property`, *optional*, defaults to `None`):
                 The scaling of the asset in the scene.
         """
-        if self.dimensionality == 3:
-            if value is None or isinstance(value, property):
-                value = [1.0, 1.0, 1.0]
-            elif isinstance(value, (int, float)):
-                value = [value, value, value]
-            elif isinstance(value, (list, tuple, np.ndarray)) and len(value) == 3:
-                value = [float(v) for v in value]
-            elif not isinstance(value, np.ndarray):
-                raise TypeError("Scale must be a float or a list of 3 numbers")
-        elif self.dimensionality == 2:
-            raise NotImplementedError()
-
-        new_scaling = np.array(value)
+        if value is None or isinstance(value, property):
+            value = [1.0, 1.0, 1.0]
+        elif isinstance(value, (int, float)):
+            value = [value, value, value]
+        elif not isinstance(value, np.ndarray) and not (isinstance(value, (list, tuple)) and len(value) == 3):
+            raise TypeError("Scale must be a float or a list of 3 numbers")
+
+        new_scaling = np.array(value, dtype=np.float64)
         if not np.array_equal(self._scaling, new_scaling):
             self._scaling = new_scaling
             self._transformation_matrix = get_transform_from_trs(self._position, self._rotation, self._scaling)
@@ -1076,13 +1135,10 @@ class Asset(NodeMixin, object):
             self._transformation_matrix = get_transform_from_trs(self._position, self._rotation, self._scaling)
             return
 
-        if self.dimensionality == 3:
-            if value is None or isinstance(value, property):
-                value = [[1, 0, 0, 0], [0, 1, 0, 0], [0, 0, 1, 0], [0, 0, 0, 1]]
-            elif not isinstance(value, (list, tuple, np.ndarray)):
-                raise TypeError("Transformation matrix must be a list of 4 lists of 4 numbers")
-        elif self.dimensionality == 2:
-            raise NotImplementedError()
+        if value is None or isinstance(value, property):
+            value = [[1, 0, 0, 0], [0, 1, 0, 0], [0, 0, 1, 0], [0, 0, 0, 1]]
+        elif not isinstance(value, (list, tuple, np.ndarray)):
+            raise TypeError("Transformation matrix must be a list of 4 lists of 4 numbers")
 
         new_transformation_matrix = np.array(value)
         if not np.array_equal(self._transformation_matrix, new_transformation_matrix):
@@ -288,19 +288,14 @@ class Collider(Asset, GltfExtensionMixin, gltf_extension_name="HF_colliders", ob
             value (`float` or `List[float]` or `np.ndarray` or `Tuple` or `property`, *optional*, defaults to `None`):
                 The position of the collider in the scene.
         """
-        if self.dimensionality == 3:
-            if value is None or isinstance(value, property):
-                value = [0.0, 0.0, 0.0]
-            elif isinstance(value, (list, tuple, np.ndarray)) and len(value) != 3:
-                raise ValueError("position should be of size 3 (X, Y, Z)")
-            elif isinstance(value, (list, tuple, np.ndarray)) and len(value) == 3:
-                value = [float(v) for v in value]
-            else:
-                raise TypeError("Position must be a list of 3 numbers")
-        elif self.dimensionality == 2:
-            raise NotImplementedError()
-
-        new_position = np.array(value)
+        if value is None or isinstance(value, property):
+            value = [0.0, 0.0, 0.0]
+        elif not isinstance(value, (list, tuple, np.ndarray)):
+            raise TypeError("Position must be a list of 3 numbers")
+        elif len(value) != 3:
+            raise ValueError("position should be of size 3 (X, Y, Z)")
+
+        new_position = np.array(value, dtype=np.float64)
         if not np.array_equal(self._position, new_position):
             self._position = new_position
             self._transformation_matrix = get_transform_from_trs(self._position, self._rotation, self._scaling)
@@ -316,19 +311,15 @@ class Collider(Asset, GltfExtensionMixin, gltf_extension_name="HF_colliders", ob
             value (`float` or `List[float]` or `np.ndarray` or `Tuple` or `property`, *optional*, defaults to `None`):
                 The rotation of the collider in the scene.
         """
-        if self.dimensionality == 3:
-            if value is None or isinstance(value, property):
-                value = [0.0, 0.0, 0.0, 1.0]
-            elif isinstance(value, (list, tuple, np.ndarray)) and len(value) == 3:
-                value = rotation_from_euler_degrees(*value)
-            elif isinstance(value, (list, tuple, np.ndarray)) and len(value) == 4:
-                value = [float(v) for v in value]
-            else:
-                raise ValueError("Rotation should be of size 3 (Euler angles) or 4 (Quaternions")
-        elif self.dimensionality == 2:
-            raise NotImplementedError()
-
-        new_rotation = np.array(value) / np.linalg.norm(value)
+        if value is None or isinstance(value, property):
+            value = [0.0, 0.0, 0.0, 1.0]
+        elif isinstance(value, (list, tuple, np.ndarray)) and len(value) == 3:
+            value = rotation_from_euler_degrees(*value)
+        elif not isinstance(value, (list, tuple, np.ndarray)) or len(value) != 4:
+            raise ValueError("Rotation should be of size 3 (Euler angles) or 4 (Quaternions")
+
+        new_rotation = np.array(value, dtype=np.float64)
+        new_rotation /= np.linalg.norm(new_rotation)
         if not np.array_equal(self._rotation, new_rotation):
             self._rotation = new_rotation
             self._transformation_matrix = get_transform_from_trs(self._position, self._rotation, self._scaling)
@@ -344,19 +335,14 @@ class Collider(Asset, GltfExtensionMixin, gltf_extension_name="HF_colliders", ob
             value (`float` or `List[float]` or `np.ndarray` or `Tuple` or `property`, *optional*, defaults to `None`):
                 The scaling of the collider in the scene.
         """
-        if self.dimensionality == 3:
-            if value is None or isinstance(value, property):
-                value = [1.0, 1.0, 1.0]
-            elif isinstance(value, (int, float)):
-                value = [value, value, value]
-            elif isinstance(value, (list, tuple, np.ndarray)) and len(value) == 3:
-                value = [float(v) for v in value]
-            elif not isinstance(value, np.ndarray):
-                raise TypeError("Scale must be a float or a list of 3 numbers")
-        elif self.dimensionality == 2:
-            raise NotImplementedError()
-
-        new_scaling = np.array(value)
+        if value is None or isinstance(value, property):
+            value = [1.0, 1.0, 1.0]
+        elif isinstance(value, (int, float)):
+            value = [value, value, value]
+        elif not isinstance(value, np.ndarray) and not (isinstance(value, (list, tuple)) and len(value) == 3):
+            raise TypeError("Scale must be a float or a list of 3 numbers")
+
+        new_scaling = np.array(value, dtype=np.float64)
         if not np.array_equal(self._scaling, new_scaling):
             self._scaling = new_scaling
             self._transformation_matrix = get_transform_from_trs(self._position, self._rotation, self._scaling)
@@ -379,13 +365,10 @@ class Collider(Asset, GltfExtensionMixin, gltf_extension_name="HF_colliders", ob
             self._transformation_matrix = get_transform_from_trs(self._position, self._rotation, self._scaling)
             return
 
-        if self.dimensionality == 3:
-            if value is None or isinstance(value, property):
-                value = [[1, 0, 0, 0], [0, 1, 0, 0], [0, 0, 1, 0], [0, 0, 0, 1]]
-            elif not isinstance(value, (list, tuple, np.ndarray)):
-                raise TypeError("Transformation matrix must be a list of 4 lists of 4 numbers")
-        elif self.dimensionality == 2:
-            raise NotImplementedError()
+        if value is None or isinstance(value, property):
+            value = [[1, 0, 0, 0], [0, 1, 0, 0], [0, 0, 1, 0], [0, 0, 0, 1]]
+        elif not isinstance(value, (list, tuple, np.ndarray)):
+            raise TypeError("Transformation matrix must be a list of 4 lists of 4 numbers")
 
         new_transformation_matrix = np.array(value)
         if not np.array_equal(self._transformation_matrix, new_transformation_matrix):
@@ -137,7 +137,7 @@ class Material:
 
         if self.name is None:
             mat_id = next(self.__class__.__NEW_ID)
-            self.name = camelcase_to_snakecase(self.__class__.__name__ + f"_{mat_id:02d}")
+            self.name = camelcase_to_snakecase(self.__class__.__name__) + f"_{mat_id:02d}"
 
     def __hash__(self) -> int:
         return id(self)
@@ -152,7 +152,7 @@ class Material:
         """
         copy_mat = copy.deepcopy(self)
         mat_id = next(self.__class__.__NEW_ID)
-        self.name = camelcase_to_snakecase(self.__class__.__name__ + f"_{mat_id:02d}")
+        self.name = camelcase_to_snakecase(self.__class__.__name__) + f"_{mat_id:02d}"
         return copy_mat
 
     # Various default colors
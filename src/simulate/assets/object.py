@@ -1650,8 +1650,8 @@ class ProcGenGrid(Object3D):
             if verbose:
                 logger.info("Seed:", seed)
 
-        # Seeding
-        np.random.seed(seed)
+        # Seeding (with a local generator, to leave numpy's global random state untouched)
+        rng = np.random.default_rng(seed)
 
         if sample_map is not None and not isinstance(sample_map, np.ndarray):
             sample_map = np.array(sample_map)
@@ -1675,6 +1675,7 @@ class ProcGenGrid(Object3D):
             "neighbors": neighbors,
             "weights": weights,
             "symmetries": symmetries,
+            "rng": rng,
             **algorithm_args,
         }
 
@@ -59,7 +59,7 @@ class PhysicMaterial(GltfExtensionMixin, gltf_extension_name="HF_physic_material
             self.bounciness = 0.0
         if self.name is None:
             class_id = next(self.__class__.__NEW_ID)
-            self.name = camelcase_to_snakecase(self.__class__.__name__ + f"_{class_id:02d}")
+            self.name = camelcase_to_snakecase(self.__class__.__name__) + f"_{class_id:02d}"
 
     def __hash__(self) -> int:
         return id(self)
@@ -74,5 +74,5 @@ class PhysicMaterial(GltfExtensionMixin, gltf_extension_name="HF_physic_material
         """
         copy_mat = copy.deepcopy(self)
         class_id = next(self.__class__.__NEW_ID)
-        self.name = camelcase_to_snakecase(self.__class__.__name__ + f"_{class_id:02d}")
+        self.name = camelcase_to_snakecase(self.__class__.__name__) + f"_{class_id:02d}"
         return copy_mat
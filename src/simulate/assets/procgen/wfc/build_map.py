@@ -26,6 +26,7 @@ def generate_2d_map(
     neighbors: Optional[np.ndarray] = None,
     symmetries: Optional[np.ndarray] = None,
     weights: Optional[np.ndarray] = None,
+    rng: Optional[np.random.Generator] = None,
 ) -> Optional[np.ndarray]:
     """
     Generate 2d map.
@@ -44,7 +45,7 @@ def generate_2d_map(
     """
 
     # Generate seed for C++
-    seed = generate_seed()
+    seed = generate_seed(rng)
 
     # Call WFC function:
     return apply_wfc(
@@ -83,6 +84,7 @@ def generate_map(
     neighbors: Optional[np.ndarray] = None,
     symmetries: Optional[np.ndarray] = None,
     weights: Optional[np.ndarray] = None,
+    rng: Optional[np.random.Generator] = None,
 ) -> Tuple[List[np.ndarray], np.ndarray]:
     """
     Generate the map.
@@ -106,6 +108,7 @@ def generate_map(
         neighbors: List of neighbors to be used by WFC.
         symmetries: List of symmetries to be used by WFC.
         weights: List of weights to be used by WFC.
+        rng: Random number generator used to seed WFC, defaults to numpy's global random state.
     """
 
     if specific_map is not None:
@@ -128,6 +131,7 @@ def generate_map(
             neighbors=neighbors,
             symmetries=symmetries,
             weights=weights,
+            rng=rng,
         )
 
     # Get the dimensions of map - since if plotting a specific_map, we might have different ones
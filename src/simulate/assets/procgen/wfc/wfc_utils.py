@@ -2,11 +2,18 @@
 Utils function for Wave function collapse.
 """
 
+from typing import Optional
+
 import numpy as np
 
 
-def generate_seed() -> int:
+def generate_seed(rng: Optional[np.random.Generator] = None) -> int:
     """
     Generate seeds to pass to the C++ side.
+
+    Args:
+        rng: The random number generator to draw the seed from, defaults to numpy's global random state.
     """
-    return np.random.randint(0, 2**32, dtype=np.uint32)
+    if rng is None:
+        return np.random.randint(0, 2**32, dtype=np.uint32)
+    return rng.integers(0, 2**32, dtype=np.uint32)
@@ -15,16 +15,114 @@
 # Lint as: python3
 import itertools
 from dataclasses import InitVar, dataclass
-from typing import Any, ClassVar, List, Optional, Tuple, Union
+from typing import Any, ClassVar, List, Optional, Sequence, Tuple, Union
 
 import numpy as np
 
+from ..utils import is_numba_available
 from .asset import Asset, get_transform_from_trs, get_trs_from_transform_matrix, rotation_from_euler_degrees
 from .gltf_extension import GltfExtensionMixin
+from .utils import get_world_transforms
 
 
+if is_numba_available():
+    from numba import njit
+
 ALLOWED_REWARD_TYPES = ["dense", "sparse", "or", "and", "not", "see", "timeout", "angle_to"]
-ALLOWED_REWARD_DISTANCE_METRICS = ["euclidean", "best_euclidean", "cosine"]  # TODO: other metrics?
+
+
+if is_numba_available():
+
+    @njit(fastmath=True, cache=True)
+    def _euclidean_distance_kernel(positions_a: np.ndarray, positions_b: np.ndarray) -> np.ndarray:
+        distances = np.empty(positions_a.shape[0])
+        for i in range(positions_a.shape[0]):
+            squared_distance = 0.0
+            for j in range(positions_a.shape[1]):
+                squared_distance += (positions_a[i, j] - positions_b[i, j]) ** 2
+            distances[i] = np.sqrt(squared_distance)
+        return distances
+
+    @njit(fastmath=True, cache=True)
+    def _cosine_similarity_kernel(positions_a: np.ndarray, positions_b: np.ndarray) -> np.ndarray:
+        similarities = np.empty(positions_a.shape[0])
+        for i in range(positions_a.shape[0]):
+            dot, squared_norm_a, squared_norm_b = 0.0, 0.0, 0.0
+            for j in range(positions_a.shape[1]):
+                dot += positions_a[i, j] * positions_b[i, j]
+                squared_norm_a += positions_a[i, j] ** 2
+                squared_norm_b += positions_b[i, j] ** 2
+            # Null positions are left as null vectors
+            if squared_norm_a > 0.0 and squared_norm_b > 0.0:
+                similarities[i] = dot / np.sqrt(squared_norm_a * squared_norm_b)
+            else:
+                similarities[i] = 0.0
+        return similarities
+
+
+def euclidean_distance(positions_a: np.ndarray, positions_b: np.ndarray) -> np.ndarray:
+    """
+    Compute the euclidean distances between two batches of positions.
+
+    Args:
+        positions_a (`np.ndarray`):
+            The positions of the first entities, of shape (N, 3).
+        positions_b (`np.ndarray`):
+            The positions of the second entities, of shape (N, 3).
+
+    Returns:
+        distances (`np.ndarray`):
+            The distances, of shape (N,).
+    """
+    positions_a, positions_b = np.broadcast_arrays(
+        np.asarray(positions_a, dtype=np.float64), np.asarray(positions_b, dtype=np.float64)
+    )
+    if is_numba_available() and positions_a.ndim == 2:
+        return _euclidean_distance_kernel(positions_a, positions_b)
+    return np.linalg.norm(positions_a - positions_b, axis=-1)
+
+
+def cosine_similarity(positions_a: np.ndarray, positions_b: np.ndarray) -> np.ndarray:
+    """
+    Compute the cosine similarities between two batches of positions (dot product of the normalized positions).
+    Null positions are left as null vectors like in the engines.
+
+    Args:
+        positions_a (`np.ndarray`):
+            The positions of the first entities, of shape (N, 3).
+        positions_b (`np.ndarray`):
+            The positions of the second entities, of shape (N, 3).
+
+    Returns:
+        similarities (`np.ndarray`):
+            The cosine similarities, of shape (N,).
+    """
+    positions_a, positions_b = np.broadcast_arrays(
+        np.asarray(positions_a, dtype=np.float64), np.asarray(positions_b, dtype=np.float64)
+    )
+    if is_numba_available() and positions_a.ndim == 2:
+        return _cosine_similarity_kernel(positions_a, positions_b)
+    norms_a = np.linalg.norm(positions_a, axis=-1, keepdims=True)
+    norms_b = np.linalg.norm(positions_b, axis=-1, keepdims=True)
+    directions_a = np.divide(positions_a, norms_a, out=np.zeros_like(positions_a), where=norms_a > 0)
+    directions_b = np.divide(positions_b, norms_b, out=np.zeros_like(positions_b), where=norms_b > 0)
+    return np.sum(directions_a * directions_b, axis=-1)
+
+
+# Vectorized implementation of each distance metric
+# ("best_euclidean" rewards improvements of the euclidean distance, the best distance is tracked by the engine)
+REWARD_DISTANCE_METRICS = {
+    "euclidean": euclidean_distance,
+    "best_euclidean": euclidean_distance,
+    "cosine": cosine_similarity,
+}  # TODO: other metrics?
+ALLOWED_REWARD_DISTANCE_METRICS = list(REWARD_DISTANCE_METRICS.keys())
+
+# Op codes of the reward types in flattened reward function trees
+REWARD_OP_CODES = {reward_type: op_code for op_code, reward_type in enumerate(ALLOWED_REWARD_TYPES)}
+# Reward types which only depend on the positions of the entities and can be evaluated outside of the engine
+FLATTENABLE_REWARD_TYPES = ["dense", "sparse", "or", "and", "not"]
+FLATTENABLE_REWARD_DISTANCE_METRICS = ["euclidean", "cosine"]
 
 
 @dataclass
@@ -147,7 +245,7 @@ class RewardFunction(Asset, GltfExtensionMixin, gltf_extension_name="HF_reward_f
             raise ValueError(f"Invalid reward type: {self.type}. Must be one of: {ALLOWED_REWARD_TYPES}")
         if self.distance_metric is None:
             self.distance_metric = "euclidean"
-        if self.distance_metric not in ALLOWED_REWARD_DISTANCE_METRICS:
+        if self.distance_metric not in REWARD_DISTANCE_METRICS:
             raise ValueError(
                 f"Invalid distance metric: {self.distance_metric}. Must be one of: {ALLOWED_REWARD_DISTANCE_METRICS}"
             )
@@ -261,19 +359,14 @@ class RewardFunction(Asset, GltfExtensionMixin, gltf_extension_name="HF_reward_f
             value (`float` or `List[float]` or `np.ndarray` or `Tuple` or `property`, *optional*, defaults to `None`):
                 The position of the reward function in the scene.
         """
-        if self.dimensionality == 3:
-            if value is None or isinstance(value, property):
-                value = [0.0, 0.0, 0.0]
-            elif isinstance(value, (list, tuple, np.ndarray)) and len(value) != 3:
-                raise ValueError("position should be of size 3 (X, Y, Z)")
-            elif isinstance(value, (list, tuple, np.ndarray)) and len(value) == 3:
-                value = [float(v) for v in value]
-            else:
-                raise TypeError("Position must be a list of 3 numbers")
-        elif self.dimensionality == 2:
-            raise NotImplementedError()
-
-        new_position = np.array(value)
+        if value is None or isinstance(value, property):
+            value = [0.0, 0.0, 0.0]
+        elif not isinstance(value, (list, tuple, np.ndarray)):
+            raise TypeError("Position must be a list of 3 numbers")
+        elif len(value) != 3:
+            raise ValueError("position should be of size 3 (X, Y, Z)")
+
+        new_position = np.array(value, dtype=np.float64)
         if not np.array_equal(self._position, new_position):
             self._position = new_position
             self._transformation_matrix = get_transform_from_trs(self._position, self._rotation, self._scaling)
@@ -289,19 +382,15 @@ class RewardFunction(Asset, GltfExtensionMixin, gltf_extension_name="HF_reward_f
             value (`float` or `List[float]` or `np.ndarray` or `Tuple` or `property`, *optional*, defaults to `None`):
                 The rotation of the reward function in the scene.
         """
-        if self.dimensionality == 3:
-            if value is None or isinstance(value, property):
-                value = [0.0, 0.0, 0.0, 1.0]
-            elif isinstance(value, (list, tuple, np.ndarray)) and len(value) == 3:
-                value = rotation_from_euler_degrees(*value)
-            elif isinstance(value, (list, tuple, np.ndarray)) and len(value) == 4:
-                value = [float(v) for v in value]
-            else:
-                raise ValueError("Rotation should be of size 3 (Euler angles) or 4 (Quaternions")
-        elif self.dimensionality == 2:
-            raise NotImplementedError()
-
-        new_rotation = np.array(value) / np.linalg.norm(value)
+        if value is None or isinstance(value, property):
+            value = [0.0, 0.0, 0.0, 1.0]
+        elif isinstance(value, (list, tuple, np.ndarray)) and len(value) == 3:
+            value = rotation_from_euler_degrees(*value)
+        elif not isinstance(value, (list, tuple, np.ndarray)) or len(value) != 4:
+            raise ValueError("Rotation should be of size 3 (Euler angles) or 4 (Quaternions")
+
+        new_rotation = np.array(value, dtype=np.float64)
+        new_rotation /= np.linalg.norm(new_rotation)
         if not np.array_equal(self._rotation, new_rotation):
             self._rotation = new_rotation
             self._transformation_matrix = get_transform_from_trs(self._position, self._rotation, self._scaling)
@@ -317,19 +406,14 @@ class RewardFunction(Asset, GltfExtensionMixin, gltf_extension_name="HF_reward_f
             value (`float` or `List[float]` or `np.ndarray` or `Tuple` or `property`, *optional*, defaults to `None`):
                 The scaling of the reward function in the scene.
         """
-        if self.dimensionality == 3:
-            if value is None or isinstance(value, property):
-                value = [1.0, 1.0, 1.0]
-            elif isinstance(value, (int, float)):
-                value = [value, value, value]
-            elif isinstance(value, (list, tuple, np.ndarray)) and len(value) == 3:
-                value = [float(v) for v in value]
-            elif not isinstance(value, np.ndarray):
-                raise TypeError("Scale must be a float or a list of 3 numbers")
-        elif self.dimensionality == 2:
-            raise NotImplementedError()
-
-        new_scaling = np.array(value)
+        if value is None or isinstance(value, property):
+            value = [1.0, 1.0, 1.0]
+        elif isinstance(value, (int, float)):
+            value = [value, value, value]
+        elif not isinstance(value, np.ndarray) and not (isinstance(value, (list, tuple)) and len(value) == 3):
+            raise TypeError("Scale must be a float or a list of 3 numbers")
+
+        new_scaling = np.array(value, dtype=np.float64)
         if not np.array_equal(self._scaling, new_scaling):
             self._scaling = new_scaling
             self._transformation_matrix = get_transform_from_trs(self._position, self._rotation, self._scaling)
@@ -352,13 +436,10 @@ class RewardFunction(Asset, GltfExtensionMixin, gltf_extension_name="HF_reward_f
             self._transformation_matrix = get_transform_from_trs(self._position, self._rotation, self._scaling)
             return
 
-        if self.dimensionality == 3:
-            if value is None or isinstance(value, property):
-                value = [[1, 0, 0, 0], [0, 1, 0, 0], [0, 0, 1, 0], [0, 0, 0, 1]]
-            elif not isinstance(value, (list, tuple, np.ndarray)):
-                raise TypeError("Transformation matrix must be a list of 4 lists of 4 numbers")
-        elif self.dimensionality == 2:
-            raise NotImplementedError()
+        if value is None or isinstance(value, property):
+            value = [[1, 0, 0, 0], [0, 1, 0, 0], [0, 0, 1, 0], [0, 0, 0, 1]]
+        elif not isinstance(value, (list, tuple, np.ndarray)):
+            raise TypeError("Transformation matrix must be a list of 4 lists of 4 numbers")
 
         new_transformation_matrix = np.array(value)
         if not np.array_equal(self._transformation_matrix, new_transformation_matrix):
@@ -370,3 +451,187 @@ class RewardFunction(Asset, GltfExtensionMixin, gltf_extension_name="HF_reward_f
             self._scaling = scale
 
             self._post_asset_modification()
+
+
+class FlatRewardFunctions:
+    """
+    Reward function trees flattened in preorder into arrays, to evaluate all the rewards of an actor at once
+    from the positions of the entities instead of traversing the trees.
+
+    Only the reward types and distance metrics which are a function of the current positions are supported
+    (see `FLATTENABLE_REWARD_TYPES` and `FLATTENABLE_REWARD_DISTANCE_METRICS`), stateful rewards
+    (timeout, best distances, sparse rewards with `trigger_once` or `is_collectable`) are only computed
+    by the engine.
+
+    Args:
+        reward_functions (`Sequence[RewardFunction]`):
+            The root reward functions to flatten (their children are flattened with them).
+
+    Attributes:
+        reward_functions (`Tuple[RewardFunction]`):
+            All the reward functions, in preorder.
+        entities (`Tuple[Asset]`):
+            The entities used by the leaf reward functions.
+        op_codes (`np.ndarray`):
+            The op code of each reward function (see `REWARD_OP_CODES`), of shape (N,).
+        children (`np.ndarray`):
+            The indices of the two children of each reward function (-1 if missing), of shape (N, 2).
+        a_idx (`np.ndarray`):
+            The index in `entities` of `entity_a` of each reward function (-1 for combinations), of shape (N,).
+        b_idx (`np.ndarray`):
+            The index in `entities` of `entity_b` of each reward function (-1 for combinations), of shape (N,).
+        scalar (`np.ndarray`):
+            The scalar of each reward function, of shape (N,).
+        threshold (`np.ndarray`):
+            The distance threshold of each reward function, of shape (N,).
+        is_root (`np.ndarray`):
+            Whether each reward function is a root whose reward is given to the actor, of shape (N,).
+    """
+
+    def __init__(self, reward_functions: Sequence[RewardFunction]):
+        nodes = []
+        for reward_function in reward_functions:
+            nodes.append(reward_function)
+            nodes.extend(reward_function.tree_descendants)
+        self.reward_functions = tuple(nodes)
+        indices = {id(node): i for i, node in enumerate(nodes)}
+
+        entities = {}
+        n_nodes = len(nodes)
+        self.op_codes = np.empty(n_nodes, dtype=np.int8)
+        self.children = np.full((n_nodes, 2), -1, dtype=np.int32)
+        self.a_idx = np.full(n_nodes, -1, dtype=np.int32)
+        self.b_idx = np.full(n_nodes, -1, dtype=np.int32)
+        self.scalar = np.array([node.scalar for node in nodes], dtype=np.float32)
+        self.threshold = np.array([node.threshold for node in nodes], dtype=np.float32)
+        self.is_root = np.array([id(node.tree_parent) not in indices for node in nodes], dtype=bool)
+        depths = np.zeros(n_nodes, dtype=np.int32)
+
+        for i, node in enumerate(nodes):
+            if node.type not in FLATTENABLE_REWARD_TYPES:
+                raise ValueError(
+                    f"Reward function {node.name} of type {node.type} can only be evaluated by the engine. "
+                    f"Flattened reward functions must be one of: {FLATTENABLE_REWARD_TYPES}"
+                )
+            self.op_codes[i] = REWARD_OP_CODES[node.type]
+            if not self.is_root[i]:
+                depths[i] = depths[indices[id(node.tree_parent)]] + 1
+
+            if node.type in ["dense", "sparse"]:
+                if node.distance_metric not in FLATTENABLE_REWARD_DISTANCE_METRICS:
+                    raise ValueError(
+                        f"Reward function {node.name} with distance metric {node.distance_metric} can only be "
+                        f"evaluated by the engine. Must be one of: {FLATTENABLE_REWARD_DISTANCE_METRICS}"
+                    )
+                if node.entity_a is None or node.entity_b is None:
+                    raise ValueError(f"Reward function {node.name} of type {node.type} needs two entities")
+                if node.type == "sparse" and (node.trigger_once or node.is_collectable):
+                    raise ValueError(
+                        f"Sparse reward function {node.name} with trigger_once or is_collectable can only be "
+                        "evaluated by the engine."
+                    )
+                self.a_idx[i] = entities.setdefault(id(node.entity_a), (len(entities), node.entity_a))[0]
+                self.b_idx[i] = entities.setdefault(id(node.entity_b), (len(entities), node.entity_b))[0]
+            else:
+                n_children = 1 if node.type == "not" else 2
+                if len(node.tree_children) < n_children:
+                    raise ValueError(f"Reward function {node.name} of type {node.type} needs {n_children} children")
+                for j, child in enumerate(node.tree_children[:n_children]):
+                    self.children[i, j] = indices[id(child)]
+
+        self.entities = tuple(entity for _, entity in entities.values())
+
+        # Leaf reward functions grouped by distance metric
+        is_leaf = self.a_idx >= 0
+        self._leaves_per_metric = {}
+        for metric in FLATTENABLE_REWARD_DISTANCE_METRICS:
+            leaves = np.flatnonzero(is_leaf & np.array([node.distance_metric == metric for node in nodes], dtype=bool))
+            if len(leaves) > 0:
+                self._leaves_per_metric[metric] = leaves
+        self._is_sparse = self.op_codes == REWARD_OP_CODES["sparse"]
+        # Scalar paid by a "not" reward for each child: the engine only sets the scalar of the leaves,
+        # the scalar of the combinations stays 1.0
+        self._not_scalar = np.where(is_leaf, self.scalar, 1.0).astype(np.float32)
+
+        # Combinations grouped by depth, deepest first, so children are always evaluated before their parents
+        self._combinations_per_depth = []
+        for depth in range(depths.max(initial=0), -1, -1):
+            combinations = {}
+            for reward_type in ["and", "or", "not"]:
+                indices_at_depth = np.flatnonzero((depths == depth) & (self.op_codes == REWARD_OP_CODES[reward_type]))
+                if len(indices_at_depth) > 0:
+                    combinations[reward_type] = indices_at_depth
+            if combinations:
+                self._combinations_per_depth.append(combinations)
+
+    def __len__(self) -> int:
+        return len(self.reward_functions)
+
+    def get_entity_positions(self) -> np.ndarray:
+        """
+        Get the current positions of the entities in the world (i.e. relative to the root of their tree).
+
+        Returns:
+            positions (`np.ndarray`):
+                The positions of the entities, of shape (n_entities, 3).
+        """
+        return get_world_transforms(self.entities)[:, :3, 3]
+
+    def compute_rewards(self, positions: Optional[np.ndarray] = None) -> np.ndarray:
+        """
+        Compute the rewards of all the reward functions.
+
+        Args:
+            positions (`np.ndarray`, *optional*, defaults to `None`):
+                The positions of the entities, of shape (..., n_entities, 3), leading dimensions can be used to
+                evaluate a batch of configurations at once. Defaults to the current positions of the entities.
+
+        Returns:
+            rewards (`np.ndarray`):
+                The reward of each reward function, of shape (..., N).
+        """
+        if positions is None:
+            positions = self.get_entity_positions()
+        positions = np.asarray(positions, dtype=np.float64)
+        rewards = np.zeros(positions.shape[:-2] + (len(self),), dtype=np.float32)
+
+        for metric, leaves in self._leaves_per_metric.items():
+            positions_a = positions[..., self.a_idx[leaves], :]
+            positions_b = positions[..., self.b_idx[leaves], :]
+            distances = REWARD_DISTANCE_METRICS[metric](
+                positions_a.reshape(-1, positions.shape[-1]), positions_b.reshape(-1, positions.shape[-1])
+            ).reshape(positions_a.shape[:-1])
+            rewards[..., leaves] = np.where(
+                self._is_sparse[leaves],
+                np.where(distances < self.threshold[leaves], self.scalar[leaves], 0.0),
+                self.scalar[leaves] * distances,
+            )
+
+        for combinations in self._combinations_per_depth:
+            for reward_type, indices in combinations.items():
+                rewards_a = rewards[..., self.children[indices, 0]]
+                if reward_type == "and":
+                    rewards[..., indices] = np.minimum(rewards_a, rewards[..., self.children[indices, 1]])
+                elif reward_type == "or":
+                    rewards[..., indices] = np.maximum(rewards_a, rewards[..., self.children[indices, 1]])
+                else:
+                    rewards[..., indices] = np.where(
+                        rewards_a <= 0.0, self._not_scalar[self.children[indices, 0]], 0.0
+                    )
+
+        return rewards
+
+    def compute_reward(self, positions: Optional[np.ndarray] = None) -> Union[float, np.ndarray]:
+        """
+        Compute the total reward of the actor, i.e. the sum of the rewards of the root reward functions.
+
+        Args:
+            positions (`np.ndarray`, *optional*, defaults to `None`):
+                The positions of the entities, of shape (..., n_entities, 3).
+                Defaults to the current positions of the entities.
+
+        Returns:
+            reward (`float` or `np.ndarray`):
+                The total reward, of shape (...).
+        """
+        return self.compute_rewards(positions)[..., self.is_root].sum(axis=-1)
@@ -15,8 +15,9 @@
 # Lint as: python3
 """ Sensors for the RL Agent."""
 import itertools
-from cmath import inf
 from dataclasses import InitVar, dataclass
+from functools import lru_cache
+from math import inf
 from typing import Any, ClassVar, List, Optional, Tuple, Union
 
 import numpy as np
@@ -73,13 +74,87 @@ def get_state_sensor_n_properties(sensor: Union["StateSensor", "RaycastSensor"])
         n_features (`int`):
             The number of properties of the sensor.
     """
+    return _count_state_sensor_properties(tuple(sensor.properties))
+
+
+@lru_cache(maxsize=None)
+def _count_state_sensor_properties(properties: Tuple[str, ...]) -> int:
+    # Memoized on the properties themselves so that it stays correct when the properties of a sensor are reassigned
     n_features = 0
-    for sensor_property in sensor.properties:
+    for sensor_property in properties:
         n_features += ALLOWED_STATE_SENSOR_PROPERTIES[sensor_property]
 
     return n_features
 
 
+@lru_cache(maxsize=None)
+def get_unbounded_box_space(n_features: int) -> spaces.Box:
+    """
+    Get the unbounded float32 Box observation space of a sensor with `n_features` values.
+    The spaces are built once and shared between all the sensors with the same number of values, so their bounds
+    are read-only.
+
+    Args:
+        n_features (`int`):
+            The number of values returned by the sensor.
+
+    Returns:
+        observation_space (`gym.spaces.Box`):
+            The observation space of the sensor.
+    """
+    observation_space = spaces.Box(low=-inf, high=inf, shape=[n_features], dtype=np.float32)
+    for bounds in [observation_space.low, observation_space.high]:
+        bounds.flags.writeable = False
+    return observation_space
+
+
+@lru_cache(maxsize=None)
+def get_raycast_directions(
+    n_horizontal_rays: int, n_vertical_rays: int, horizontal_fov: float, vertical_fov: float
+) -> np.ndarray:
+    """
+    Get the unit direction vectors of the rays cast by a raycast sensor, in the frame of the sensor
+    (x to the right, y up and z forward). Rays are spread evenly over the field of view and ordered like in the
+    engine: horizontal index first, then vertical index, positive horizontal angles turning right and positive
+    vertical angles looking down.
+    The tables are built once and shared between all the sensors with the same rays.
+
+    Args:
+        n_horizontal_rays (`int`):
+            The number of horizontal rays.
+        n_vertical_rays (`int`):
+            The number of vertical rays.
+        horizontal_fov (`float`):
+            The horizontal field of view in degrees.
+        vertical_fov (`float`):
+            The vertical field of view in degrees.
+
+    Returns:
+        directions (`np.ndarray`):
+            The (read-only) float32 directions of the rays, of shape (n_horizontal_rays * n_vertical_rays, 3).
+    """
+    horizontal_step = horizontal_fov / n_horizontal_rays
+    vertical_step = vertical_fov / n_vertical_rays
+    horizontal_angles = np.radians(
+        (horizontal_step - horizontal_fov) / 2 + np.arange(n_horizontal_rays) * horizontal_step
+    )
+    vertical_angles = np.radians((vertical_step - vertical_fov) / 2 + np.arange(n_vertical_rays) * vertical_step)
+
+    horizontal_angles, vertical_angles = np.meshgrid(horizontal_angles, vertical_angles, indexing="ij")
+    directions = np.stack(
+        [
+            np.cos(vertical_angles) * np.sin(horizontal_angles),
+            -np.sin(vertical_angles),
+            np.cos(vertical_angles) * np.cos(horizontal_angles),
+        ],
+        axis=-1,
+    ).reshape(-1, 3)
+
+    directions = directions.astype(np.float32)
+    directions.flags.writeable = False
+    return directions
+
+
 @dataclass
 class StateSensor(Asset, GltfExtensionMixin, gltf_extension_name="HF_state_sensors", object_type="node"):
     """
@@ -155,7 +230,7 @@ class StateSensor(Asset, GltfExtensionMixin, gltf_extension_name="HF_state_senso
             self.properties = ["distance"]
         if not isinstance(self.properties, (list, tuple)):
             self.properties = [self.properties]
-        elif any(properties_ not in ALLOWED_STATE_SENSOR_PROPERTIES for properties_ in self.properties):
+        if any(properties_ not in ALLOWED_STATE_SENSOR_PROPERTIES for properties_ in self.properties):
             raise ValueError(
                 f"The properties {self.properties} is not a valid StateSensor properties"
                 f"\nAllowed properties are: {ALLOWED_STATE_SENSOR_PROPERTIES}"
@@ -170,7 +245,7 @@ class StateSensor(Asset, GltfExtensionMixin, gltf_extension_name="HF_state_senso
             observation_space (`gym.spaces.Box`):
                 The observation space of the sensor.
         """
-        return spaces.Box(low=-inf, high=inf, shape=[get_state_sensor_n_properties(self)], dtype=np.float32)
+        return get_unbounded_box_space(get_state_sensor_n_properties(self))
 
     ##############################
     # Properties copied from Asset()
@@ -236,19 +311,14 @@ class StateSensor(Asset, GltfExtensionMixin, gltf_extension_name="HF_state_senso
             value (`float` or `List[float]` or `np.ndarray` or `Tuple` or `property`, *optional*, defaults to `None`):
                 The position of the sensor in the scene.
         """
-        if self.dimensionality == 3:
-            if value is None or isinstance(value, property):
-                value = [0.0, 0.0, 0.0]
-            elif isinstance(value, (list, tuple, np.ndarray)) and len(value) != 3:
-                raise ValueError("position should be of size 3 (X, Y, Z)")
-            elif isinstance(value, (list, tuple, np.ndarray)) and len(value) == 3:
-                value = [float(v) for v in value]
-            else:
-                raise TypeError("Position must be a list of 3 numbers")
-        elif self.dimensionality == 2:
-            raise NotImplementedError()
-
-        new_position = np.array(value)
+        if value is None or isinstance(value, property):
+            value = [0.0, 0.0, 0.0]
+        elif not isinstance(value, (list, tuple, np.ndarray)):
+            raise TypeError("Position must be a list of 3 numbers")
+        elif len(value) != 3:
+            raise ValueError("position should be of size 3 (X, Y, Z)")
+
+        new_position = np.array(value, dtype=np.float64)
         if not np.array_equal(self._position, new_position):
             self._position = new_position
             self._transformation_matrix = get_transform_from_trs(self._position, self._rotation, self._scaling)
@@ -264,19 +334,15 @@ class StateSensor(Asset, GltfExtensionMixin, gltf_extension_name="HF_state_senso
             value (`float` or `List[float]` or `np.ndarray` or `Tuple` or `property`, *optional*, defaults to `None`):
                 The rotation of the sensor in the scene.
         """
-        if self.dimensionality == 3:
-            if value is None or isinstance(value, property):
-                value = [0.0, 0.0, 0.0, 1.0]
-            elif isinstance(value, (list, tuple, np.ndarray)) and len(value) == 3:
-                value = rotation_from_euler_degrees(*value)
-            elif isinstance(value, (list, tuple, np.ndarray)) and len(value) == 4:
-                value = [float(v) for v in value]
-            else:
-                raise ValueError("Rotation should be of size 3 (Euler angles) or 4 (Quaternions")
-        elif self.dimensionality == 2:
-            raise NotImplementedError()
-
-        new_rotation = np.array(value) / np.linalg.norm(value)
+        if value is None or isinstance(value, property):
+            value = [0.0, 0.0, 0.0, 1.0]
+        elif isinstance(value, (list, tuple, np.ndarray)) and len(value) == 3:
+            value = rotation_from_euler_degrees(*value)
+        elif not isinstance(value, (list, tuple, np.ndarray)) or len(value) != 4:
+            raise ValueError("Rotation should be of size 3 (Euler angles) or 4 (Quaternions")
+
+        new_rotation = np.array(value, dtype=np.float64)
+        new_rotation /= np.linalg.norm(new_rotation)
         if not np.array_equal(self._rotation, new_rotation):
             self._rotation = new_rotation
             self._transformation_matrix = get_transform_from_trs(self._position, self._rotation, self._scaling)
@@ -292,19 +358,14 @@ class StateSensor(Asset, GltfExtensionMixin, gltf_extension_name="HF_state_senso
             value (`float` or `List[float]` or `np.ndarray` or `Tuple` or `property`, *optional*, defaults to `None`):
                 The scaling of the sensor in the scene.
         """
-        if self.dimensionality == 3:
-            if value is None or isinstance(value, property):
-                value = [1.0, 1.0, 1.0]
-            elif isinstance(value, (int, float)):
-                value = [value, value, value]
-            elif isinstance(value, (list, tuple, np.ndarray)) and len(value) == 3:
-                value = [float(v) for v in value]
-            elif not isinstance(value, np.ndarray):
-                raise TypeError("Scale must be a float or a list of 3 numbers")
-        elif self.dimensionality == 2:
-            raise NotImplementedError()
-
-        new_scaling = np.array(value)
+        if value is None or isinstance(value, property):
+            value = [1.0, 1.0, 1.0]
+        elif isinstance(value, (int, float)):
+            value = [value, value, value]
+        elif not isinstance(value, np.ndarray) and not (isinstance(value, (list, tuple)) and len(value) == 3):
+            raise TypeError("Scale must be a float or a list of 3 numbers")
+
+        new_scaling = np.array(value, dtype=np.float64)
         if not np.array_equal(self._scaling, new_scaling):
             self._scaling = new_scaling
             self._transformation_matrix = get_transform_from_trs(self._position, self._rotation, self._scaling)
@@ -327,13 +388,10 @@ class StateSensor(Asset, GltfExtensionMixin, gltf_extension_name="HF_state_senso
             self._transformation_matrix = get_transform_from_trs(self._position, self._rotation, self._scaling)
             return
 
-        if self.dimensionality == 3:
-            if value is None or isinstance(value, property):
-                value = [[1, 0, 0, 0], [0, 1, 0, 0], [0, 0, 1, 0], [0, 0, 0, 1]]
-            elif not isinstance(value, (list, tuple, np.ndarray)):
-                raise TypeError("Transformation matrix must be a list of 4 lists of 4 numbers")
-        elif self.dimensionality == 2:
-            raise NotImplementedError()
+        if value is None or isinstance(value, property):
+            value = [[1, 0, 0, 0], [0, 1, 0, 0], [0, 0, 1, 0], [0, 0, 0, 1]]
+        elif not isinstance(value, (list, tuple, np.ndarray)):
+            raise TypeError("Transformation matrix must be a list of 4 lists of 4 numbers")
 
         new_transformation_matrix = np.array(value)
         if not np.array_equal(self._transformation_matrix, new_transformation_matrix):
@@ -359,9 +417,9 @@ class RaycastSensor(Asset, GltfExtensionMixin, gltf_extension_name="HF_raycast_s
         n_vertical_rays (`int`, *optional*, defaults to `1`):
             The number of vertical rays to cast.
         horizontal_fov (`float`, *optional*, defaults to `0.0`):
-            The horizontal field of view of the sensor.
+            The horizontal field of view of the sensor in degrees.
         vertical_fov (`float`, *optional*, defaults to `0.0`):
-            The vertical field of view of the sensor.
+            The vertical field of view of the sensor in degrees.
         ray_length (`float`, *optional*, defaults to `100.0`):
             The length of the ray to cast.
         sensor_tag (`str`, *optional*, defaults to `"RaycastSensor"`):
@@ -426,7 +484,20 @@ class RaycastSensor(Asset, GltfExtensionMixin, gltf_extension_name="HF_raycast_s
             observation_space (`gym.spaces.Box`):
                 The observation space of the sensor.
         """
-        return spaces.Box(low=-inf, high=inf, shape=[self.n_horizontal_rays * self.n_vertical_rays], dtype=np.float32)
+        return get_unbounded_box_space(self.n_horizontal_rays * self.n_vertical_rays)
+
+    @property
+    def ray_directions(self) -> np.ndarray:
+        """
+        Get the directions of the rays cast by the sensor, in the frame of the sensor.
+
+        Returns:
+            ray_directions (`np.ndarray`):
+                The unit direction vectors of the rays, of shape (n_horizontal_rays * n_vertical_rays, 3).
+        """
+        return get_raycast_directions(
+            self.n_horizontal_rays, self.n_vertical_rays, self.horizontal_fov, self.vertical_fov
+        )
 
     ##############################
     # Properties copied from Asset()
@@ -492,19 +563,14 @@ class RaycastSensor(Asset, GltfExtensionMixin, gltf_extension_name="HF_raycast_s
             value (`float` or `List[float]` or `np.ndarray` or `Tuple` or `property`, *optional*, defaults to `None`):
                 The position of the sensor in the scene.
         """
-        if self.dimensionality == 3:
-            if value is None or isinstance(value, property):
-                value = [0.0, 0.0, 0.0]
-            elif isinstance(value, (list, tuple, np.ndarray)) and len(value) != 3:
-                raise ValueError("position should be of size 3 (X, Y, Z)")
-            elif isinstance(value, (list, tuple, np.ndarray)) and len(value) == 3:
-                value = [float(v) for v in value]
-            else:
-                raise TypeError("Position must be a list of 3 numbers")
-        elif self.dimensionality == 2:
-            raise NotImplementedError()
-
-        new_position = np.array(value)
+        if value is None or isinstance(value, property):
+            value = [0.0, 0.0, 0.0]
+        elif not isinstance(value, (list, tuple, np.ndarray)):
+            raise TypeError("Position must be a list of 3 numbers")
+        elif len(value) != 3:
+            raise ValueError("position should be of size 3 (X, Y, Z)")
+
+        new_position = np.array(value, dtype=np.float64)
         if not np.array_equal(self._position, new_position):
             self._position = new_position
             self._transformation_matrix = get_transform_from_trs(self._position, self._rotation, self._scaling)
@@ -520,19 +586,15 @@ class RaycastSensor(Asset, GltfExtensionMixin, gltf_extension_name="HF_raycast_s
             value (`float` or `List[float]` or `np.ndarray` or `Tuple` or `property`, *optional*, defaults to `None`):
                 The rotation of the sensor in the scene.
         """
-        if self.dimensionality == 3:
-            if value is None or isinstance(value, property):
-                value = [0.0, 0.0, 0.0, 1.0]
-            elif isinstance(value, (list, tuple, np.ndarray)) and len(value) == 3:
-                value = rotation_from_euler_degrees(*value)
-            elif isinstance(value, (list, tuple, np.ndarray)) and len(value) == 4:
-                value = [float(v) for v in value]
-            else:
-                raise ValueError("Rotation should be of size 3 (Euler angles) or 4 (Quaternions")
-        elif self.dimensionality == 2:
-            raise NotImplementedError()
-
-        new_rotation = np.array(value) / np.linalg.norm(value)
+        if value is None or isinstance(value, property):
+            value = [0.0, 0.0, 0.0, 1.0]
+        elif isinstance(value, (list, tuple, np.ndarray)) and len(value) == 3:
+            value = rotation_from_euler_degrees(*value)
+        elif not isinstance(value, (list, tuple, np.ndarray)) or len(value) != 4:
+            raise ValueError("Rotation should be of size 3 (Euler angles) or 4 (Quaternions")
+
+        new_rotation = np.array(value, dtype=np.float64)
+        new_rotation /= np.linalg.norm(new_rotation)
         if not np.array_equal(self._rotation, new_rotation):
             self._rotation = new_rotation
             self._transformation_matrix = get_transform_from_trs(self._position, self._rotation, self._scaling)
@@ -548,19 +610,14 @@ class RaycastSensor(Asset, GltfExtensionMixin, gltf_extension_name="HF_raycast_s
             value (`float` or `List[float]` or `np.ndarray` or `Tuple` or `property`, *optional*, defaults to `None`):
                 The scaling of the sensor in the scene.
         """
-        if self.dimensionality == 3:
-            if value is None or isinstance(value, property):
-                value = [1.0, 1.0, 1.0]
-            elif isinstance(value, (int, float)):
-                value = [value, value, value]
-            elif isinstance(value, (list, tuple, np.ndarray)) and len(value) == 3:
-                value = [float(v) for v in value]
-            elif not isinstance(value, np.ndarray):
-                raise TypeError("Scale must be a float or a list of 3 numbers")
-        elif self.dimensionality == 2:
-            raise NotImplementedError()
-
-        new_scaling = np.array(value)
+        if value is None or isinstance(value, property):
+            value = [1.0, 1.0, 1.0]
+        elif isinstance(value, (int, float)):
+            value = [value, value, value]
+        elif not isinstance(value, np.ndarray) and not (isinstance(value, (list, tuple)) and len(value) == 3):
+            raise TypeError("Scale must be a float or a list of 3 numbers")
+
+        new_scaling = np.array(value, dtype=np.float64)
         if not np.array_equal(self._scaling, new_scaling):
             self._scaling = new_scaling
             self._transformation_matrix = get_transform_from_trs(self._position, self._rotation, self._scaling)
@@ -583,13 +640,10 @@ class RaycastSensor(Asset, GltfExtensionMixin, gltf_extension_name="HF_raycast_s
             self._transformation_matrix = get_transform_from_trs(self._position, self._rotation, self._scaling)
             return
 
-        if self.dimensionality == 3:
-            if value is None or isinstance(value, property):
-                value = [[1, 0, 0, 0], [0, 1, 0, 0], [0, 0, 1, 0], [0, 0, 0, 1]]
-            elif not isinstance(value, (list, tuple, np.ndarray)):
-                raise TypeError("Transformation matrix must be a list of 4 lists of 4 numbers")
-        elif self.dimensionality == 2:
-            raise NotImplementedError()
+        if value is None or isinstance(value, property):
+            value = [[1, 0, 0, 0], [0, 1, 0, 0], [0, 0, 1, 0], [0, 0, 0, 1]]
+        elif not isinstance(value, (list, tuple, np.ndarray)):
+            raise TypeError("Transformation matrix must be a list of 4 lists of 4 numbers")
 
         new_transformation_matrix = np.array(value)
         if not np.array_equal(self._transformation_matrix, new_transformation_matrix):
@@ -15,11 +15,18 @@
 # Lint as: python3
 """Utilities."""
 import itertools
+import math
 import re
+from functools import lru_cache
 from typing import List, Optional, Tuple, Union
 
 import numpy as np
 
+from ..utils import is_numba_available
+
+
+if is_numba_available():
+    from numba import njit, prange
 
 _uppercase_uppercase_re = re.compile(r"([A-Z]+)([A-Z][a-z])")
 _lowercase_uppercase_re = re.compile(r"([a-z\d])([A-Z])")
@@ -28,9 +35,11 @@ _single_underscore_re = re.compile(r"(?<!_)_(?!_)")
 _multiple_underscores_re = re.compile(r"(_{2,})")
 
 
+@lru_cache(maxsize=256)
 def camelcase_to_snakecase(name: str) -> str:
     """
     Convert camel-case string to snake-case.
+    Results are cached since this is mostly called with class names when naming new instances.
 
     Args:
         name (`str`):
@@ -209,6 +218,37 @@ def get_trs_from_transform_matrix(transform_matrix: np.ndarray) -> Tuple[np.ndar
     return translation, rotation, scale
 
 
+def get_world_transforms(nodes: List) -> np.ndarray:
+    """
+    Compute the world transformation matrices (i.e. relative to the root of their tree) of several nodes at once.
+    The world transform of each ancestor is computed only once and reused by all the nodes which share it,
+    instead of multiplying the whole path from the root for every node.
+
+    Args:
+        nodes (`List[Asset]`):
+            The nodes to compute the world transforms of.
+
+    Returns:
+        world_transforms (`np.ndarray`):
+            The world transformation matrices, of shape (n_nodes, 4, 4).
+    """
+    world_transforms = np.empty((len(nodes), 4, 4))
+    cache = {}
+    for i, node in enumerate(nodes):
+        # Walk up to the closest ancestor already computed, then down again multiplying the local transforms
+        path = []
+        while node is not None and id(node) not in cache:
+            path.append(node)
+            node = node.tree_parent
+        transform = cache[id(node)] if node is not None else None
+        for ancestor in reversed(path):
+            local_transform = ancestor.transformation_matrix
+            transform = local_transform if transform is None else transform @ local_transform
+            cache[id(ancestor)] = transform
+        world_transforms[i] = transform
+    return world_transforms
+
+
 def get_product_of_quaternions(q: Union[np.ndarray, List[float]], r: Union[np.ndarray, List[float]]) -> np.ndarray:
     """
     Compute the product of two quaternions.
@@ -251,10 +291,16 @@ def rotation_from_euler_radians(x: float, y: float, z: float) -> List[float]:
         rotation (`list`):
             The rotation quaternion.
     """
-    qx = np.sin(x / 2) * np.cos(y / 2) * np.cos(z / 2) - np.cos(x / 2) * np.sin(y / 2) * np.sin(z / 2)
-    qy = np.cos(x / 2) * np.sin(y / 2) * np.cos(z / 2) + np.sin(x / 2) * np.cos(y / 2) * np.sin(z / 2)
-    qz = np.cos(x / 2) * np.cos(y / 2) * np.sin(z / 2) - np.sin(x / 2) * np.sin(y / 2) * np.cos(z / 2)
-    qw = np.cos(x / 2) * np.cos(y / 2) * np.cos(z / 2) + np.sin(x / 2) * np.sin(y / 2) * np.sin(z / 2)
+    # Compute the half-angle sines/cosines once and reuse them for the four components
+    # (scalar math functions are much cheaper than numpy ufuncs on single floats)
+    sx, cx = math.sin(x / 2), math.cos(x / 2)
+    sy, cy = math.sin(y / 2), math.cos(y / 2)
+    sz, cz = math.sin(z / 2), math.cos(z / 2)
+
+    qx = sx * cy * cz - cx * sy * sz
+    qy = cx * sy * cz + sx * cy * sz
+    qz = cx * cy * sz - sx * sy * cz
+    qw = cx * cy * cz + sx * sy * sz
     return [qx, qy, qz, qw]
 
 
@@ -277,6 +323,72 @@ def rotation_from_euler_degrees(x: float, y: float, z: float) -> List[float]:
     return rotation_from_euler_radians(np.radians(x), np.radians(y), np.radians(z))
 
 
+if is_numba_available():
+
+    @njit(parallel=True, fastmath=True, cache=True)
+    def _rotations_from_euler_radians_kernel(euler: np.ndarray) -> np.ndarray:
+        rotations = np.empty((euler.shape[0], 4))
+        for i in prange(euler.shape[0]):
+            sx, cx = np.sin(euler[i, 0] / 2), np.cos(euler[i, 0] / 2)
+            sy, cy = np.sin(euler[i, 1] / 2), np.cos(euler[i, 1] / 2)
+            sz, cz = np.sin(euler[i, 2] / 2), np.cos(euler[i, 2] / 2)
+            rotations[i, 0] = sx * cy * cz - cx * sy * sz
+            rotations[i, 1] = cx * sy * cz + sx * cy * sz
+            rotations[i, 2] = cx * cy * sz - sx * sy * cz
+            rotations[i, 3] = cx * cy * cz + sx * sy * sz
+        return rotations
+
+
+def rotations_from_euler_radians(euler: Union[np.ndarray, List[List[float]]]) -> np.ndarray:
+    """
+    Return rotation quaternions from a batch of Euler angles in radians.
+    Vectorized version of `rotation_from_euler_radians` to use when building many assets at once
+    (compiled with numba if it is installed).
+
+    Args:
+        euler (`np.ndarray` or `list`):
+            The rotations in radians around the x, y and z axes, of shape (N, 3).
+
+    Returns:
+        rotations (`np.ndarray`):
+            The rotation quaternions, of shape (N, 4).
+    """
+    euler = np.asarray(euler, dtype=np.float64)
+    if euler.ndim != 2 or euler.shape[1] != 3:
+        raise ValueError("The Euler angles should be of shape (N, 3)")
+
+    if is_numba_available():
+        return _rotations_from_euler_radians_kernel(euler)
+
+    half_angles = euler / 2
+    (sx, sy, sz), (cx, cy, cz) = np.sin(half_angles).T, np.cos(half_angles).T
+
+    return np.stack(
+        [
+            sx * cy * cz - cx * sy * sz,
+            cx * sy * cz + sx * cy * sz,
+            cx * cy * sz - sx * sy * cz,
+            cx * cy * cz + sx * sy * sz,
+        ],
+        axis=1,
+    )
+
+
+def rotations_from_euler_degrees(euler: Union[np.ndarray, List[List[float]]]) -> np.ndarray:
+    """
+    Return rotation quaternions from a batch of Euler angles in degrees.
+
+    Args:
+        euler (`np.ndarray` or `list`):
+            The rotations in degrees around the x, y and z axes, of shape (N, 3).
+
+    Returns:
+        rotations (`np.ndarray`):
+            The rotation quaternions, of shape (N, 4).
+    """
+    return rotations_from_euler_radians(np.radians(euler))
+
+
 def euler_from_quaternion(quaternion: Union[np.ndarray, List[float]]) -> List[float]:
     """
     Convert a quaternion into euler angles (roll, pitch, yaw).
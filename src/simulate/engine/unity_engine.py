@@ -231,6 +231,7 @@ class UnityEngine(Engine):
         self.client, self.client_address = self.socket.accept()
         # self.client.setblocking(0)  # Set to non-blocking
         self.client.settimeout(SOCKET_TIME_OUT)  # Set a timeout
+        self._receive_buffer = bytearray()
         logger.info(f"Connection from {self.client_address}")
 
     def _get_response(self) -> str:
@@ -243,15 +244,35 @@ class UnityEngine(Engine):
         """
         while True:
 
-            data_length = self.client.recv(4)
-            data_length = int.from_bytes(data_length, "little")
+            data_length = int.from_bytes(self._receive_bytes(4), "little")
 
             if data_length:
-                response = ""  # TODO: string concatenation may be slow
-                while len(response) < data_length:
-                    response += self.client.recv(data_length - len(response)).decode()
+                # Decode only once the whole message is received (chunks are not aligned on characters)
+                return str(self._receive_bytes(data_length), "utf-8")
 
-                return response
+    def _receive_bytes(self, n_bytes: int) -> memoryview:
+        """
+        Receive exactly `n_bytes` from the socket, directly into a receive buffer reused between messages.
+
+        Args:
+            n_bytes (`int`):
+                The number of bytes to receive.
+
+        Returns:
+            data (`memoryview`):
+                A view on the received bytes, only valid until the next call.
+        """
+        if len(self._receive_buffer) < n_bytes:
+            self._receive_buffer = bytearray(n_bytes)
+        data = memoryview(self._receive_buffer)[:n_bytes]
+
+        n_received = 0
+        while n_received < n_bytes:
+            n_chunk = self.client.recv_into(data[n_received:], n_bytes - n_received)
+            if n_chunk == 0:
+                raise ConnectionError("The connection with the Unity executable was closed.")
+            n_received += n_chunk
+        return data
 
     def update_asset(self, root_node: "Asset"):
         # TODO update and make this API more consistent with all the
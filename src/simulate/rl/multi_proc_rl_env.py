@@ -12,11 +12,13 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from collections import defaultdict
+import select
 from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple, Type, Union
 
 import numpy as np
 
+from ..engine.unity_engine import SOCKET_TIME_OUT
+
 
 try:
     import gym
@@ -32,7 +34,11 @@ try:
 except ImportError:
 
     class VecEnv:
-        pass  # Dummy class if SB3 is not installed
+        # Dummy class if SB3 is not installed
+        def __init__(self, num_envs: int, observation_space: Any, action_space: Any):
+            self.num_envs = num_envs
+            self.observation_space = observation_space
+            self.action_space = action_space
 
     class VecEnvIndices:
         pass  # Dummy class if SB3 is not installed
@@ -45,6 +51,10 @@ class MultiProcessRLEnv(VecEnv):
     Uses functionality from the VecEnv in stable baselines 3. For more information on VecEnv, see the source
     https://stable-baselines3.readthedocs.io/en/master/guide/vec_envs.html
 
+    Stepping can also be done asynchronously (like in EnvPool): `send_actions` dispatches actions to some of the
+    executables and `recv_obs` returns as soon as `batch_size` of them have answered, so that the policy can run
+    on a batch while the other executables are still simulating.
+
     Args:
         env_fn (`Callable`): a generator function that returns a RLEnv / ParallelRLEnv for generating instances
             of the desired environment.
@@ -66,6 +76,13 @@ class MultiProcessRLEnv(VecEnv):
             action_space = env.action_space
             self.envs.append(env)
 
+        # ids of the executables which have been sent actions and whose response has not been received yet
+        self._pending_env_ids = []
+
+        # two sets of preallocated observation buffers (one array per sensor), used alternately
+        self._obs_buffers = [{}, {}]
+        self._obs_buffer_id = 0
+
         num_envs = self.n_show * self.n_parallel
         super().__init__(num_envs, observation_space, action_space)
 
@@ -82,21 +99,87 @@ class MultiProcessRLEnv(VecEnv):
             all_done (`bool`): TODO
             all_info: TODO
         """
+        self.step_async(actions)
+        return self.step_wait()
+
+    def send_actions(self, actions: Optional[Union[list, np.ndarray]] = None, env_ids: Optional[List[int]] = None):
+        """
+        Send actions to some of the executables without waiting for their response.
+
+        Args:
+            actions (`List` or `np.ndarray`, *optional*, defaults to `None`):
+                The actions for the selected executables, concatenated in the order of `env_ids`
+                (`n_show` actions per executable).
+            env_ids (`List[int]`, *optional*, defaults to `None`):
+                The executables to step. Defaults to all the executables.
+        """
+        if env_ids is None:
+            env_ids = range(self.n_parallel)
         if isinstance(actions, list):
             actions = np.array(actions)
 
-        for i in range(self.n_parallel):
-            # TODO comment what is going on here
+        # Check all the ids before sending anything, to never leave the executables half-stepped
+        if len(set(env_ids)) != len(env_ids):
+            raise ValueError(f"Executable ids must be unique, got {list(env_ids)}.")
+        for env_id in env_ids:
+            if env_id in self._pending_env_ids:
+                raise ValueError(f"Executable {env_id} is still stepping, receive its observations first.")
+
+        for i, env_id in enumerate(env_ids):
             action = actions[i * self.n_show : (i + 1) * self.n_show] if actions is not None else None
-            self.envs[i].step_send_async(action)
+            self.envs[env_id].step_send_async(action)
+            self._pending_env_ids.append(env_id)
+
+    def recv_obs(
+        self, batch_size: Optional[int] = None
+    ) -> Tuple[Dict, np.ndarray, np.ndarray, List[Dict], np.ndarray]:
+        """
+        Receive the results of the first `batch_size` executables to finish stepping.
+
+        Args:
+            batch_size (`int`, *optional*, defaults to `None`):
+                The number of executables to wait for. Defaults to all the executables currently stepping.
+
+        Returns:
+            all_observation (`Dict`): the observations of the returned executables, concatenated along the first axis.
+            all_reward (`np.ndarray`): the rewards of the returned executables.
+            all_done (`np.ndarray`): whether each episode is done.
+            all_info (`List[Dict]`): a list of dict of additional information.
+            env_ids (`np.ndarray`): the (sorted) ids of the returned executables.
+        """
+        if not self._pending_env_ids:
+            raise ValueError("No executable is stepping, send actions first.")
+        if batch_size is None:
+            batch_size = len(self._pending_env_ids)
+        if batch_size < 1:
+            raise ValueError(f"Cannot receive {batch_size} results, the batch size must be at least 1.")
+        if batch_size > len(self._pending_env_ids):
+            raise ValueError(
+                f"Cannot receive {batch_size} results, only {len(self._pending_env_ids)} executables are stepping."
+            )
+
+        # Wait on the engine sockets and keep the first executables which answer
+        ready_env_ids = []
+        while len(ready_env_ids) < batch_size:
+            clients = {self.envs[env_id].scene.engine.client: env_id for env_id in self._pending_env_ids}
+            readable, _, _ = select.select(list(clients.keys()), [], [], SOCKET_TIME_OUT)
+            if not readable:
+                raise TimeoutError(
+                    f"Executables {sorted(clients.values())} did not answer within {SOCKET_TIME_OUT} seconds."
+                )
+            for client in readable[: batch_size - len(ready_env_ids)]:
+                env_id = clients[client]
+                ready_env_ids.append(env_id)
+                self._pending_env_ids.remove(env_id)
+        ready_env_ids.sort()
 
         all_obs = []
         all_reward = []
         all_done = []
         all_info = []
 
-        for i in range(self.n_parallel):
-            obs, reward, done, info = self.envs[i].step_recv_async()
+        for env_id in ready_env_ids:
+            obs, reward, done, info = self.envs[env_id].step_recv_async()
 
             all_obs.append(obs)
             all_reward.extend(reward)
@@ -107,24 +190,48 @@ class MultiProcessRLEnv(VecEnv):
         all_reward = np.array(all_reward)
         all_done = np.array(all_done)
 
-        return all_obs, all_reward, all_done, all_info
+        return all_obs, all_reward, all_done, all_info, np.array(ready_env_ids)
 
-    @staticmethod
-    def _combine_obs(obs):
-        out = defaultdict(list)
-        np_out = defaultdict(np.ndarray)
+    def _combine_obs(self, obs: List[Dict]) -> Dict[str, np.ndarray]:
+        """
+        Copy the observations of several executables into contiguous preallocated buffers.
 
-        for o in obs:
-            for key, value in o.items():
-                out[key].append(value)
+        Two sets of buffers are used alternately so that the observations returned by the previous call
+        (e.g. kept by SB3 as `_last_obs`) are not overwritten. Copy the returned arrays to keep them longer.
 
-        for key in out.keys():
-            np_out[key] = np.concatenate(out[key], axis=0)
+        Args:
+            obs (`List[Dict]`): a list of dict of observations for each sensor.
 
-        return np_out
+        Returns:
+            all_obs (`Dict`): a dict of observations for all sensors, concatenated along the first axis.
+        """
+        self._obs_buffer_id = 1 - self._obs_buffer_id
+        buffers = self._obs_buffers[self._obs_buffer_id]
+
+        all_obs = {}
+        for key, value in obs[0].items():
+            n_rows = sum(len(o[key]) for o in obs)
+            buffer = buffers.get(key)
+            if (
+                buffer is None
+                or len(buffer) < n_rows
+                or buffer.shape[1:] != value.shape[1:]
+                or buffer.dtype != value.dtype
+            ):
+                buffer = np.empty((max(n_rows, self.n_show * self.n_parallel), *value.shape[1:]), dtype=value.dtype)
+                buffers[key] = buffer
+            np.concatenate([o[key] for o in obs], axis=0, out=buffer[:n_rows])
+            all_obs[key] = buffer[:n_rows]
+
+        return all_obs
 
     def reset(self):
         # we aren't performing this async as this happens rarely as the env auto resets
+        # drop the results of the executables still stepping so that their replies are not read as reset replies
+        for env_id in self._pending_env_ids:
+            self.envs[env_id].step_recv_async()
+        self._pending_env_ids = []
+
         all_obs = []
         for i in range(self.n_parallel):
             obs = self.envs[i].reset()
@@ -143,12 +250,29 @@ class MultiProcessRLEnv(VecEnv):
     # required abstract methods
 
     def step_async(self, actions: np.ndarray) -> None:
-        raise NotImplementedError()
+        self.send_actions(actions)
 
-    def seed(self, seed: Optional[int] = None):  # -> List[Union[None, int]]:
-        # this should be done when the env is initialized
-        return
-        # raise NotImplementedError()
+    def step_wait(self) -> Tuple[Dict, np.ndarray, np.ndarray, List[Dict]]:
+        obs, reward, done, info, _ = self.recv_obs(batch_size=self.n_parallel)
+        return obs, reward, done, info
+
+    def seed(self, seed: Optional[int] = None) -> List[Union[None, int]]:
+        """
+        Seed the action sampling of each executable with an independent stream spawned from `seed`
+        (using `np.random.SeedSequence`), so that the executables never sample the same actions.
+        The simulations and maps themselves are not seeded by this method.
+
+        Args:
+            seed (`int`, *optional*, defaults to `None`):
+                The root seed. Fresh entropy is used if `None`.
+
+        Returns:
+            seeds (`List[int]`): the seeds used by each executable.
+        """
+        seeds = []
+        for env, seed_sequence in zip(self.envs, np.random.SeedSequence(seed).spawn(self.n_parallel)):
+            seeds.extend(env.seed(int(seed_sequence.generate_state(1)[0])))
+        return seeds
 
     def get_attr(self, attr_name: str, indices: VecEnvIndices = None) -> List[Any]:
         raise NotImplementedError()
@@ -164,6 +288,3 @@ class MultiProcessRLEnv(VecEnv):
 
     def step_send(self):
         raise NotImplementedError()
-
-    def step_wait(self):
-        raise NotImplementedError()
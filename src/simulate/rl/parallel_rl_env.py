@@ -334,10 +334,19 @@ class ParallelRLEnv(VecEnv):
     def env_method(self, method_name: str, *method_args, indices: VecEnvIndices = None, **method_kwargs) -> List[Any]:
         raise NotImplementedError()
 
-    def seed(self, seed: Optional[int] = None):  # -> List[Union[None, int]]:
-        # this should be done when the env is initialized
-        return
-        # raise NotImplementedError()
+    def seed(self, seed: Optional[int] = None) -> List[Union[None, int]]:
+        """
+        Seed the random number generator used to sample actions.
+        The simulation itself is seeded when the environment is initialized.
+
+        Args:
+            seed (`int`, *optional*, defaults to `None`):
+                The seed to use.
+
+        Returns:
+            seeds (`List[int]`): the seeds used.
+        """
+        return self.action_space.seed(seed)
 
     def set_attr(self, attr_name: str, value: Any, indices: VecEnvIndices = None) -> None:
         raise NotImplementedError()
@@ -12,4 +12,4 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from .imports import is_fastwfc_available, is_vhacd_available
+from .imports import is_fastwfc_available, is_numba_available, is_vhacd_available
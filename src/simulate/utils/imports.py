@@ -18,6 +18,7 @@ import importlib.util
 
 _vhacd_available = importlib.util.find_spec("simulate._vhacd") is not None
 _fastwfc_available = importlib.util.find_spec("simulate._fastwfc") is not None
+_numba_available = importlib.util.find_spec("numba") is not None
 
 
 def is_vhacd_available():
@@ -26,3 +27,7 @@ def is_vhacd_available():
 
 def is_fastwfc_available():
     return _fastwfc_available
+
+
+def is_numba_available():
+    return _numba_available
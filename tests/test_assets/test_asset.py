@@ -220,6 +220,26 @@ class AssetTest(unittest.TestCase):
         )
         np.testing.assert_allclose(asset.transformation_matrix, transformation_mat)
 
+    def test_tree_transforms(self):
+        root = sm.Asset(name="root", position=[1, 2, 3])
+        child = sm.Asset(name="child", rotation=ROTATION, scaling=SCALE)
+        root += child
+        root += sm.Asset(name="other_child")
+
+        transforms = root.tree_transforms
+        self.assertEqual(transforms.shape, (3, 10))
+        self.assertEqual(transforms.dtype, np.float32)
+        self.assertTrue(transforms.flags["C_CONTIGUOUS"])
+        np.testing.assert_allclose(transforms[0], [1, 2, 3, 0, 0, 0, 1, 1, 1, 1])
+        np.testing.assert_allclose(transforms[1, 3:7], child.rotation, rtol=1e-6)
+        np.testing.assert_allclose(transforms[1, 7:10], SCALE)
+
+        # The buffer grows with the tree
+        child += sm.Asset(name="grand_child", position=[4, 5, 6])
+        transforms = root.tree_transforms
+        self.assertEqual(transforms.shape, (4, 10))
+        np.testing.assert_allclose(transforms[2, 0:3], [4, 5, 6])
+
     def test_get_asset(self):
         asset = sm.Asset()
         bobby_asset = sm.Asset(name="bobby")
@@ -14,8 +14,12 @@
 
 # Lint as: python3
 import unittest
+from unittest import mock
+
+import numpy as np
 
 import simulate as sm
+from simulate.utils import is_numba_available
 
 
 # TODO add more tests on saving/exporting/loading in gltf files
@@ -29,6 +33,101 @@ class RewardsTest(unittest.TestCase):
         self.assertIs(reward.entity_a, a)
         self.assertIs(reward.entity_b, b)
 
+    def test_distance_metrics(self):
+        positions_a = np.array([[0.0, 0.0, 0.0], [1.0, 0.0, 0.0], [0.0, 2.0, 0.0]])
+        positions_b = np.array([[3.0, 4.0, 0.0], [2.0, 0.0, 0.0], [0.0, 0.0, 5.0]])
+
+        # numpy fallback
+        with mock.patch("simulate.assets.reward_functions.is_numba_available", return_value=False):
+            distances = sm.euclidean_distance(positions_a, positions_b)
+            similarities = sm.cosine_similarity(positions_a, positions_b)
+        np.testing.assert_allclose(distances, [5.0, 1.0, np.sqrt(29.0)])
+        np.testing.assert_allclose(similarities, [0.0, 1.0, 0.0])
+        self.assertIs(sm.REWARD_DISTANCE_METRICS["best_euclidean"], sm.euclidean_distance)
+
+        with self.assertRaises(ValueError):
+            sm.RewardFunction(distance_metric="manhattan")
+
+    @unittest.skipUnless(is_numba_available(), "numba is not installed")
+    def test_distance_metrics_numba(self):
+        positions_a, positions_b = np.random.default_rng(0).normal(size=(2, 100, 3))
+        positions_b[0] = 0.0
+        for metric in [sm.euclidean_distance, sm.cosine_similarity]:
+            with mock.patch("simulate.assets.reward_functions.is_numba_available", return_value=False):
+                expected = metric(positions_a, positions_b)
+            np.testing.assert_allclose(metric(positions_a, positions_b), expected, atol=1e-12)
+
+    def test_flat_reward_functions(self):
+        actor = sm.Asset(name="actor", position=[0, 0, 0], is_actor=True)
+        target = sm.Asset(name="target", position=[3, 4, 0])
+        scene = sm.Scene()
+        scene += [actor, target]
+
+        dense = sm.RewardFunction(type="dense", entity_a=actor, entity_b=target, scalar=-1.0)
+        actor += dense
+        sparse = sm.RewardFunction(
+            type="sparse", entity_a=actor, entity_b=target, threshold=1.0, scalar=2.0, trigger_once=False
+        )
+        # "not" rewards pay the scalar of their child
+        actor += sm.RewardFunction(type="not", reward_function_a=sparse, scalar=0.5)
+
+        flat_reward_functions = actor.flat_reward_functions
+        self.assertEqual(len(flat_reward_functions), 3)
+        self.assertEqual(flat_reward_functions.is_root.tolist(), [True, True, False])
+        np.testing.assert_allclose(flat_reward_functions.compute_rewards(), [-5.0, 2.0, 0.0])
+        self.assertAlmostEqual(flat_reward_functions.compute_reward(), -3.0)
+
+        # Batch of entity positions
+        positions = np.array([[[0.0, 0.0, 0.0], [3.0, 4.0, 0.0]], [[0.0, 0.0, 0.0], [0.5, 0.0, 0.0]]])
+        np.testing.assert_allclose(flat_reward_functions.compute_reward(positions), [-3.0, -0.5])
+
+        # Stateful sparse rewards are only computed by the engine
+        for kwargs in [{}, {"trigger_once": False, "is_collectable": True}]:
+            other = sm.Asset(name="other", is_actor=True)
+            scene += other
+            other += sm.RewardFunction(type="sparse", entity_a=other, entity_b=target, **kwargs)
+            with self.assertRaises(ValueError):
+                other.flat_reward_functions
+            scene -= other
+
+        # Built once and rebuilt when the reward functions or their fields change
+        self.assertIs(actor.flat_reward_functions, flat_reward_functions)
+        dense.scalar = -2.0
+        np.testing.assert_allclose(actor.flat_reward_functions.compute_rewards(), [-10.0, 2.0, 0.0])
+        closer_target = sm.Asset(name="closer_target", position=[0, 0, 2])
+        scene += closer_target
+        dense.entity_b = closer_target
+        dense.scalar = -1.0
+        np.testing.assert_allclose(actor.flat_reward_functions.compute_rewards(), [-2.0, 2.0, 0.0])
+        dense.entity_b = target
+        flat_reward_functions = actor.flat_reward_functions
+        self.assertEqual(flat_reward_functions.entities, (actor, target))
+
+        # Like in the engine, only the direct children of the actor are its reward functions
+        actor += sm.Asset(name="holder")
+        actor.holder += sm.RewardFunction(type="dense", entity_a=actor, entity_b=target)
+        self.assertIs(actor.flat_reward_functions, flat_reward_functions)
+
+        actor += sm.RewardFunction(type="timeout", entity_a=actor, entity_b=actor)
+        with self.assertRaises(ValueError):
+            actor.flat_reward_functions
+
+    def test_flat_not_reward_function(self):
+        actor = sm.Asset(name="actor", position=[0, 0, 0], is_actor=True)
+        target = sm.Asset(name="target", position=[3, 4, 0])
+        scene = sm.Scene()
+        scene += [actor, target]
+
+        # The scalar of combinations is not used by the engine, a "not" over a combination pays 1.0
+        dense = sm.RewardFunction(type="dense", entity_a=actor, entity_b=target, scalar=-1.0)
+        sparse = sm.RewardFunction(
+            type="sparse", entity_a=actor, entity_b=target, threshold=1.0, scalar=2.0, trigger_once=False
+        )
+        both = sm.RewardFunction(type="and", reward_function_a=dense, reward_function_b=sparse, scalar=3.0)
+        actor += sm.RewardFunction(type="not", reward_function_a=both, scalar=0.5)
+
+        np.testing.assert_allclose(actor.flat_reward_functions.compute_rewards(), [1.0, -5.0, -5.0, 0.0])
+
     def test_reward_children(self):
         reward = sm.RewardFunction(type="and")
         a = sm.Asset(name="a")
@@ -37,6 +37,53 @@ class ObservationsTest(unittest.TestCase):
 
         with self.assertRaises(ValueError):
             _ = sm.StateSensor(None, None, properties=["position", "distance", "position,x"])
+        with self.assertRaises(ValueError):
+            _ = sm.StateSensor(None, None, properties="position,x")
+
+        state_sensor = sm.StateSensor(None, None, properties="velocity")
+        self.assertEqual(state_sensor.observation_space.shape, (3,))
+
+        # The observation space follows the properties when they are reassigned
+        state_sensor.properties = ["position", "velocity"]
+        self.assertEqual(state_sensor.observation_space.shape, (6,))
+
+        # The number of properties is counted once per set of properties
+        count_properties = sm.assets.sensors._count_state_sensor_properties
+        hits = count_properties.cache_info().hits
+        self.assertEqual(state_sensor.observation_space.shape, (6,))
+        self.assertEqual(count_properties.cache_info().hits, hits + 1)
+
+    def test_observation_space_is_shared(self):
+        sensor_a = sm.StateSensor(None, None, properties=["position"])
+        sensor_b = sm.StateSensor(None, None, properties=["velocity"])
+        self.assertIs(sensor_a.observation_space, sensor_a.observation_space)
+        self.assertIs(sensor_a.observation_space, sensor_b.observation_space)
+        # The bounds of shared spaces can't be edited in place
+        with self.assertRaises(ValueError):
+            sensor_a.observation_space.low[0] = 0.0
+        with self.assertRaises(ValueError):
+            sensor_a.observation_space.high[0] = 0.0
+        self.assertEqual(sensor_b.observation_space.low[0], -np.inf)
+
+        raycast_sensor = sm.RaycastSensor(n_horizontal_rays=3, n_vertical_rays=1)
+        self.assertIs(raycast_sensor.observation_space, sensor_a.observation_space)
+
+        raycast_sensor.n_vertical_rays = 2
+        self.assertEqual(raycast_sensor.observation_space.shape, (6,))
+
+    def test_raycast_directions(self):
+        raycast_sensor = sm.RaycastSensor()
+        np.testing.assert_allclose(raycast_sensor.ray_directions, [[0.0, 0.0, 1.0]], atol=1e-7)
+
+        raycast_sensor = sm.RaycastSensor(n_horizontal_rays=2, n_vertical_rays=3, horizontal_fov=90, vertical_fov=60)
+        directions = raycast_sensor.ray_directions
+        self.assertEqual(directions.shape, (6, 3))
+        self.assertEqual(directions.dtype, np.float32)
+        np.testing.assert_allclose(np.linalg.norm(directions, axis=1), 1.0, rtol=1e-6)
+        # Horizontal index first: first rays turn left, vertical angles go from looking up to looking down
+        np.testing.assert_allclose(directions[:3, 0], -np.sin(np.radians(22.5)) * np.cos(np.radians([-20, 0, 20])))
+        np.testing.assert_allclose(directions[:3, 1], -np.sin(np.radians([-20, 0, 20])), atol=1e-7)
+        self.assertIs(raycast_sensor.ray_directions, directions)
 
     def test_obj_position(self):
         obj = sm.StateSensor()
@@ -14,10 +14,12 @@
 
 # Lint as: python3
 import unittest
+from unittest import mock
 
 import numpy as np
 
 import simulate as sm
+from simulate.utils import is_numba_available
 
 
 TRANSLATION = [10.0, 20.0, 30.0]
@@ -76,3 +78,36 @@ class UtilsTest(unittest.TestCase):
         euler = [0.0, 0.0, 90.0]
         rotation = sm.utils.rotation_from_euler_degrees(*euler)
         np.testing.assert_allclose(rotation, [0.0, 0.0, np.sin(np.pi / 4), np.cos(np.pi / 4)], rtol=1e-03)
+
+    def test_get_world_transforms(self):
+        root = sm.Asset(name="root", position=[1, 0, 0], rotation=[0, 90, 0])
+        root += sm.Asset(name="child", position=[0, 0, 2], scaling=2)
+        root.child += sm.Asset(name="grandchild", position=[0, 1, 0], rotation=[30, 0, 0])
+        root += sm.Asset(name="other_child", position=[0, 3, 0])
+
+        nodes = [root.child.grandchild, root, root.other_child, root.child]
+        world_transforms = sm.get_world_transforms(nodes)
+        self.assertEqual(world_transforms.shape, (4, 4, 4))
+        for node, world_transform in zip(nodes, world_transforms):
+            transforms = [n.transformation_matrix for n in node.tree_path]
+            expected = np.linalg.multi_dot(transforms) if len(transforms) > 1 else transforms[0]
+            np.testing.assert_allclose(world_transform, expected)
+
+    def test_rotations_from_euler(self):
+        euler = np.array([[0.0, 0.0, 0.0], [0.0, 0.0, 90.0], [30.0, -45.0, 120.0]])
+        # numpy fallback
+        with mock.patch("simulate.assets.utils.is_numba_available", return_value=False):
+            rotations = sm.utils.rotations_from_euler_degrees(euler)
+        self.assertEqual(rotations.shape, (3, 4))
+        for angles, rotation in zip(euler, rotations):
+            np.testing.assert_allclose(rotation, sm.utils.rotation_from_euler_degrees(*angles), atol=1e-8)
+
+        with self.assertRaises(ValueError):
+            sm.utils.rotations_from_euler_radians([0.0, 0.0, 0.0])
+
+    @unittest.skipUnless(is_numba_available(), "numba is not installed")
+    def test_rotations_from_euler_numba(self):
+        euler = np.random.default_rng(0).uniform(-180.0, 180.0, size=(100, 3))
+        with mock.patch("simulate.assets.utils.is_numba_available", return_value=False):
+            expected_rotations = sm.utils.rotations_from_euler_degrees(euler)
+        np.testing.assert_allclose(sm.utils.rotations_from_euler_degrees(euler), expected_rotations, atol=1e-12)
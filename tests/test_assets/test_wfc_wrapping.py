@@ -1,9 +1,12 @@
 """Tests of WFC wrapping functions."""
 
 import unittest
+from unittest import mock
 
 import numpy as np
 
+import simulate as sm
+from simulate.assets.procgen.wfc import build_map, generate_seed
 from simulate.assets.procgen.wfc.wfc_wrapping import (
     apply_wfc,
     preprocess_input_img,
@@ -117,3 +120,35 @@ class TestSampleMap(unittest.TestCase):
 
 if __name__ == "__main__":
     unittest.main()
+
+
+class TestSeeds(unittest.TestCase):
+    def test_generate_seed(self):
+        seeds = [generate_seed(np.random.default_rng(42)) for _ in range(2)]
+        self.assertEqual(seeds[0], seeds[1])
+        self.assertEqual(seeds[0], np.random.default_rng(42).integers(0, 2**32, dtype=np.uint32))
+
+        # The seed is drawn from the generator, not from numpy's global random state
+        rng = np.random.default_rng(42)
+        state = np.random.get_state()
+        generate_seed(rng)
+        self.assertNotEqual(generate_seed(rng), seeds[0])
+        np.testing.assert_array_equal(np.random.get_state()[1], state[1])
+
+    def test_proc_gen_grid_seed(self):
+        # WFC is replaced by a mock recording the seeds passed to the C++ side
+        apply_wfc = mock.Mock(return_value=np.zeros((1, 9, 9), dtype=np.uint8))
+        with mock.patch.object(build_map, "apply_wfc", apply_wfc), mock.patch(
+            "simulate.assets.object.generate_2d_map", build_map.generate_2d_map, create=True
+        ):
+            np.random.seed(0)
+            state = np.random.get_state()
+            for seed in [42, 42, 43]:
+                sm.ProcGenGrid(sample_map=np.zeros((3, 3)), shallow=True, seed=seed)
+
+        # Seeding is reproducible and leaves numpy's global random state untouched
+        seeds = [call.kwargs["seed"] for call in apply_wfc.call_args_list]
+        self.assertEqual(seeds[0], seeds[1])
+        self.assertNotEqual(seeds[0], seeds[2])
+        self.assertEqual(np.random.get_state()[2], state[2])
+        np.testing.assert_array_equal(np.random.get_state()[1], state[1])
@@ -0,0 +1,91 @@
+# Copyright 2022 The HuggingFace Authors.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# Lint as: python3
+import json
+import socket
+import threading
+import time
+import unittest
+
+from simulate.engine.unity_engine import UnityEngine
+
+
+def encode_message(message: str) -> bytes:
+    data = message.encode("utf-8")
+    return len(data).to_bytes(4, "little") + data
+
+
+class UnityEngineSocketTest(unittest.TestCase):
+    def setUp(self):
+        # Connect the engine to one end of a socket pair instead of a Unity executable
+        self.client, self.executable = socket.socketpair()
+        self.engine = UnityEngine.__new__(UnityEngine)
+        self.engine.client = self.client
+        self.engine._receive_buffer = bytearray()
+
+    def tearDown(self):
+        self.client.close()
+        self.executable.close()
+
+    def send_in_chunks(self, data: bytes, chunk_size: int = 1):
+        def send():
+            for i in range(0, len(data), chunk_size):
+                self.executable.sendall(data[i : i + chunk_size])
+                time.sleep(0.001)
+
+        thread = threading.Thread(target=send)
+        thread.start()
+        return thread
+
+    def test_get_response(self):
+        self.executable.sendall(encode_message("first") + encode_message("second"))
+        self.assertEqual(self.engine._get_response(), "first")
+        self.assertEqual(self.engine._get_response(), "second")
+
+    def test_short_reads(self):
+        # Multi-byte characters are split across chunks, including the length prefix
+        message = "état: ✓ – 🤗"
+        thread = self.send_in_chunks(encode_message(message))
+        self.assertEqual(self.engine._get_response(), message)
+        thread.join()
+
+    def test_empty_messages_are_skipped(self):
+        self.executable.sendall((0).to_bytes(4, "little") + encode_message("message"))
+        self.assertEqual(self.engine._get_response(), "message")
+
+    def test_receive_buffer_reuse(self):
+        self.executable.sendall(encode_message("a" * 100) + encode_message("b" * 10) + encode_message("c" * 1000))
+        self.assertEqual(self.engine._get_response(), "a" * 100)
+        receive_buffer = self.engine._receive_buffer
+        self.assertEqual(self.engine._get_response(), "b" * 10)
+        self.assertIs(self.engine._receive_buffer, receive_buffer)
+        # Grown for larger messages
+        self.assertEqual(self.engine._get_response(), "c" * 1000)
+        self.assertGreaterEqual(len(self.engine._receive_buffer), 1000)
+
+    def test_get_response_async(self):
+        self.executable.sendall(encode_message(json.dumps({"ok": True, "name": "✓"})))
+        self.assertEqual(self.engine.get_response_async(), {"ok": True, "name": "✓"})
+
+    def test_closed_connection(self):
+        # Closed in the middle of a message
+        self.executable.sendall(encode_message("message")[:6])
+        self.executable.close()
+        with self.assertRaises(ConnectionError):
+            self.engine._get_response()
+
+    def test_closed_connection_between_messages(self):
+        self.executable.close()
+        with self.assertRaises(ConnectionError):
+            self.engine._get_response()
@@ -0,0 +1,190 @@
+# Copyright 2022 The HuggingFace Authors.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# Lint as: python3
+import socket
+import unittest
+from types import SimpleNamespace
+from unittest import mock
+
+import numpy as np
+
+import simulate as sm
+
+
+class FakeEnv:
+    """Stand-in for a RLEnv connected to an executable: the executable answers when `respond` is called."""
+
+    def __init__(self, env_id: int, n_show: int = 1):
+        self.env_id = env_id
+        self.n_show = n_show
+        self.observation_space = None
+        self.action_space = None
+        self.client, self.executable = socket.socketpair()
+        self.scene = SimpleNamespace(engine=SimpleNamespace(client=self.client), close=self.close)
+        self.actions = []
+        self.n_steps = 0
+        self.obs_size = 2
+        self.obs_dtype = np.float32
+
+    def respond(self):
+        self.executable.sendall(b"\x00")
+
+    def step_send_async(self, action):
+        self.actions.append(action)
+
+    def step_recv_async(self):
+        self.client.recv(1)
+        self.n_steps += 1
+        obs = {"state": np.full((self.n_show, self.obs_size), 100 * self.env_id + self.n_steps, dtype=self.obs_dtype)}
+        return obs, np.full(self.n_show, float(self.env_id)), np.zeros(self.n_show, dtype=bool), [{}] * self.n_show
+
+    def seed(self, seed=None):
+        self.action_seed = seed
+        return [seed]
+
+    def reset(self):
+        return {"state": np.full((self.n_show, self.obs_size), 100 * self.env_id, dtype=self.obs_dtype)}
+
+    def close(self):
+        self.client.close()
+        self.executable.close()
+
+
+class MultiProcessRLEnvTest(unittest.TestCase):
+    def setUp(self):
+        self.fake_envs = []
+
+        def env_fn(port):
+            self.fake_envs.append(FakeEnv(len(self.fake_envs)))
+            return self.fake_envs[-1]
+
+        self.env = sm.MultiProcessRLEnv(env_fn, n_parallel=3)
+
+    def tearDown(self):
+        self.env.close()
+
+    def test_send_actions_recv_obs(self):
+        self.env.send_actions(np.array([[0], [1], [2]]))
+        self.assertEqual([env.actions[-1].tolist() for env in self.fake_envs], [[[0]], [[1]], [[2]]])
+
+        # Only the first executables to answer are returned, sorted by id
+        self.fake_envs[2].respond()
+        self.fake_envs[0].respond()
+        obs, reward, done, info, env_ids = self.env.recv_obs(batch_size=2)
+        self.assertEqual(env_ids.tolist(), [0, 2])
+        self.assertEqual(obs["state"][:, 0].tolist(), [1, 201])
+        self.assertEqual(reward.tolist(), [0, 2])
+        self.assertEqual(len(info), 2)
+
+        # Executable 1 is still stepping
+        with self.assertRaises(ValueError):
+            self.env.recv_obs(batch_size=2)
+        with self.assertRaises(ValueError):
+            self.env.send_actions(np.array([[0], [1]]), env_ids=[0, 1])
+        with self.assertRaises(ValueError):
+            self.env.send_actions(np.array([[0], [0]]), env_ids=[0, 0])
+        # Nothing was sent when the ids are invalid
+        self.assertEqual(len(self.fake_envs[0].actions), 1)
+
+        self.fake_envs[1].respond()
+        obs, reward, done, info, env_ids = self.env.recv_obs()
+        self.assertEqual(env_ids.tolist(), [1])
+        self.assertEqual(obs["state"][:, 0].tolist(), [101])
+
+    def test_recv_obs_errors(self):
+        # Nothing is stepping
+        with self.assertRaises(ValueError):
+            self.env.recv_obs()
+        with self.assertRaises(ValueError):
+            self.env.recv_obs(batch_size=0)
+
+        self.env.send_actions(env_ids=[0])
+        with self.assertRaises(ValueError):
+            self.env.recv_obs(batch_size=0)
+
+        # A stalled executable does not hang forever
+        with mock.patch("simulate.rl.multi_proc_rl_env.SOCKET_TIME_OUT", 0.01):
+            with self.assertRaises(TimeoutError):
+                self.env.recv_obs()
+
+    def test_reset_while_stepping(self):
+        self.env.send_actions(env_ids=[0, 1])
+        self.fake_envs[0].respond()
+        self.fake_envs[1].respond()
+
+        # The pending step replies are received before resetting
+        obs = self.env.reset()
+        self.assertEqual(obs["state"][:, 0].tolist(), [0, 100, 200])
+        self.assertEqual([fake_env.n_steps for fake_env in self.fake_envs], [1, 1, 0])
+        with self.assertRaises(ValueError):
+            self.env.recv_obs()
+
+        self.env.send_actions(env_ids=[0])
+        self.fake_envs[0].respond()
+        _, _, _, _, env_ids = self.env.recv_obs()
+        self.assertEqual(env_ids.tolist(), [0])
+
+    def test_seed(self):
+        seeds = self.env.seed(42)
+        self.assertEqual(seeds, [fake_env.action_seed for fake_env in self.fake_envs])
+        self.assertEqual(len(set(seeds)), 3)
+        self.assertEqual(self.env.seed(42), seeds)
+        self.assertNotEqual(self.env.seed(43), seeds)
+
+    def respond_all(self):
+        for fake_env in self.fake_envs:
+            fake_env.respond()
+
+    def test_observation_buffers(self):
+        obs_reset = self.env.reset()
+        self.respond_all()
+        obs_1, _, _, _ = self.env.step()
+        self.respond_all()
+        obs_2, _, _, _ = self.env.step()
+
+        # The observations of the previous step are not overwritten by the next one
+        self.assertEqual(obs_1["state"][:, 0].tolist(), [1, 101, 201])
+        self.assertEqual(obs_2["state"][:, 0].tolist(), [2, 102, 202])
+        self.assertFalse(np.shares_memory(obs_1["state"], obs_2["state"]))
+        # but the buffers are reused two calls later
+        self.assertTrue(np.shares_memory(obs_reset["state"], obs_2["state"]))
+
+        # Partial batches are views on the same buffers
+        self.env.send_actions()
+        self.fake_envs[1].respond()
+        obs_3, _, _, _, env_ids = self.env.recv_obs(batch_size=1)
+        self.assertEqual(env_ids.tolist(), [1])
+        self.assertEqual(obs_3["state"].shape, (1, 2))
+        self.assertEqual(obs_3["state"][:, 0].tolist(), [103])
+        self.assertTrue(np.shares_memory(obs_1["state"], obs_3["state"]))
+        self.assertEqual(obs_2["state"][:, 0].tolist(), [2, 102, 202])
+
+        self.fake_envs[0].respond()
+        self.fake_envs[2].respond()
+        obs_4, _, _, _, env_ids = self.env.recv_obs()
+        self.assertEqual(env_ids.tolist(), [0, 2])
+        self.assertEqual(obs_4["state"][:, 0].tolist(), [3, 203])
+        self.assertEqual(obs_3["state"][:, 0].tolist(), [103])
+
+        # The buffers are reallocated when the shape or the dtype of the observations change
+        for fake_env in self.fake_envs:
+            fake_env.obs_size = 4
+            fake_env.obs_dtype = np.uint8
+        self.respond_all()
+        obs_5, _, _, _ = self.env.step()
+        self.assertEqual(obs_5["state"].shape, (3, 4))
+        self.assertEqual(obs_5["state"].dtype, np.uint8)
+        self.assertEqual(obs_5["state"][:, 0].tolist(), [4, 104, 204])
+        self.assertFalse(np.shares_memory(obs_3["state"], obs_5["state"]))